@@ -6,3 +6,17 @@ RX_SENSITIVITY = -120
 HANDOVER_HYSTERESIS = 3.0
 DEFAULT_CAPACITY = 100
 
+# A3 event (neighbour better than serving by offset for time_to_trigger seconds);
+# the defaults give evaluate_handover's rule (exactly so only with RERANK_DISTANCE = 0)
+A3_OFFSET = HANDOVER_HYSTERESIS
+TIME_TO_TRIGGER = 0
+# Incremental handover: full neighbour re-ranking after this many metres of movement,
+# or when the tracked neighbour is within this many dB of the A3 threshold
+RERANK_DISTANCE = 10.0
+RERANK_MARGIN = 3.0
+
+# CellStateStore: initial rows (cells) and occupancy columns (grown by doubling);
+# occupancy snapshot period in simulated seconds
+STATE_INITIAL_CELLS = 64
+STATE_INITIAL_SAMPLES = 1024
+SAMPLE_EVERY = 1
@@ -3,15 +3,16 @@ Base Station module.
 """
 from .constants import TX_POWER, RX_SENSITIVITY, HANDOVER_HYSTERESIS, DEFAULT_CAPACITY
 from session.core import CallSession
-from utils import load_config
 
-config = load_config("config.yaml")     
 
 class BaseStation:
+    __slots__ = ('id', '_counters', 'state_index', 'tx_power', 'rx_sensitivity', 'location_x', 'location_y',
+                 'neighbors', 'frequency', 'bandwidth', 'antenna_type')
+
     def __init__(self, id, capacity, location_x, location_y, frequency, bandwidth, antenna_type):
         self.id = id
-        self.capacity = capacity
-        self.current_calls = 0
+        self._counters = [0, capacity]
+        self.state_index = None
         self.tx_power = TX_POWER
         self.rx_sensitivity = RX_SENSITIVITY
         self.location_x = location_x
@@ -21,22 +22,44 @@ class BaseStation:
         self.bandwidth = bandwidth
         self.antenna_type = antenna_type
 
+    def bind(self, counters, state_index):
+        """Back current_calls/capacity by a row of a CellStateStore (see base_station/state.py)."""
+        self._counters = counters
+        self.state_index = state_index
+
+    @property
+    def current_calls(self):
+        return int(self._counters[0])
+
+    @current_calls.setter
+    def current_calls(self, value):
+        self._counters[0] = value
+
+    @property
+    def capacity(self):
+        return int(self._counters[1])
+
+    @capacity.setter
+    def capacity(self, value):
+        self._counters[1] = value
+
     def connect_call(self, subscriber, duration, start_time):
         if self.current_calls < self.capacity:
             if subscriber.make_call(duration):
                 self.current_calls += 1
                 return CallSession(subscriber, self, duration, start_time)
             return None
-        else:
-            print("Вышка перегружена")
-            return False
+        return False
 
 
     @staticmethod
-    def get_all_base_stations():
+    def get_all_base_stations(config):
         """
-        Load all base stations from config.yaml.
-        
+        Build all base stations described by a parsed config (see utils.load_config).
+
+        Args:
+            config: Configuration dictionary with a 'base_stations' list
+
         Returns:
             Dictionary of BaseStation objects keyed by station ID
         """
@@ -0,0 +1,112 @@
+"""
+Array-backed cell state: call counters, busy time and occupancy snapshots per base station.
+"""
+import math
+import numpy as np
+from .constants import STATE_INITIAL_CELLS, STATE_INITIAL_SAMPLES, SAMPLE_EVERY
+
+CALLS = 0
+CAPACITY = 1
+
+
+class CellStateStore:
+    """
+    Struct-of-arrays store, one row per registered cell:
+    counters[:, CALLS] / counters[:, CAPACITY], busy_seconds (integral of current calls over
+    simulated time) and occupancy[cell, k] = current calls at time (k + 1) * sample_every.
+    Registered BaseStations read and write their counters row through properties.
+    """
+
+    def __init__(self, sample_every=SAMPLE_EVERY, max_samples=STATE_INITIAL_SAMPLES, cells=STATE_INITIAL_CELLS):
+        self.size = 0
+        self.counters = np.zeros((cells, 2), dtype=np.int64)
+        self.busy_seconds = np.zeros(cells)
+        self.occupancy = np.zeros((cells, max_samples), dtype=np.int32)
+        self.samples = 0
+        self.sample_every = sample_every
+        self.start_time = 0.0
+        self.time = 0.0
+        self.base_stations = []
+        self.index_by_id = {}
+
+    def register(self, base_station):
+        """Copy the station's counters into the arrays and bind it to its row. Returns row index."""
+        index = self.index_by_id.get(base_station.id)
+        if index is None:
+            if self.size == len(self.counters):
+                self._grow_cells()
+            index = self.size
+            self.size += 1
+            self.base_stations.append(base_station)
+            self.index_by_id[base_station.id] = index
+        else:
+            self.base_stations[index] = base_station
+        self.counters[index] = (base_station.current_calls, base_station.capacity)
+        base_station.bind(self.counters[index], index)
+        return index
+
+    def advance(self, now):
+        """
+        Account for simulated time up to `now`: add current calls x elapsed seconds to
+        busy_seconds and record one snapshot per sample time crossed (counters are
+        constant in between, so this is exact for tick and event-driven runs alike).
+        """
+        elapsed = now - self.time
+        if elapsed <= 0:
+            return
+        calls = self.counters[:self.size, CALLS]
+        self.busy_seconds[:self.size] += calls * elapsed
+        first = math.floor(self.time / self.sample_every) + 1
+        last = math.floor(now / self.sample_every)
+        if last >= first:
+            needed = self.samples + last - first + 1
+            if needed > self.occupancy.shape[1]:
+                self._grow_samples(needed)
+            self.occupancy[:self.size, self.samples:needed] = calls[:, None]
+            self.samples = needed
+        self.time = now
+
+    def elapsed(self):
+        return self.time - self.start_time
+
+    def carried_erlangs(self):
+        """Mean number of simultaneous calls per cell over the run (array, row order)."""
+        elapsed = self.elapsed()
+        return self.busy_seconds[:self.size] / elapsed if elapsed > 0 else np.zeros(self.size)
+
+    def utilization(self):
+        """Carried Erlangs / capacity per cell."""
+        capacity = self.counters[:self.size, CAPACITY]
+        return np.divide(self.carried_erlangs(), capacity, out=np.zeros(self.size), where=capacity > 0)
+
+    def occupancy_series(self):
+        """(cells, samples) view of the recorded snapshots."""
+        return self.occupancy[:self.size, :self.samples]
+
+    def busiest(self, n=5):
+        """Top-n cells by carried traffic: [(base_station, erlangs, utilization, peak_calls)]."""
+        erlangs = self.carried_erlangs()
+        utilization = self.utilization()
+        series = self.occupancy_series()
+        peaks = series.max(axis=1) if self.samples else np.zeros(self.size, dtype=np.int32)
+        order = np.argsort(-erlangs, kind='stable')[:n]
+        return [(self.base_stations[i], float(erlangs[i]), float(utilization[i]), int(peaks[i])) for i in order]
+
+    def _grow_cells(self):
+        """Double row capacity; stations are rebound because their row views go stale."""
+        rows = 2 * len(self.counters)
+        counters = np.zeros((rows, 2), dtype=np.int64)
+        counters[:self.size] = self.counters[:self.size]
+        busy_seconds = np.zeros(rows)
+        busy_seconds[:self.size] = self.busy_seconds[:self.size]
+        occupancy = np.zeros((rows, self.occupancy.shape[1]), dtype=np.int32)
+        occupancy[:self.size] = self.occupancy[:self.size]
+        self.counters, self.busy_seconds, self.occupancy = counters, busy_seconds, occupancy
+        for index, base_station in enumerate(self.base_stations):
+            base_station.bind(self.counters[index], index)
+
+    def _grow_samples(self, needed):
+        columns = max(needed, 2 * self.occupancy.shape[1])
+        occupancy = np.zeros((self.occupancy.shape[0], columns), dtype=np.int32)
+        occupancy[:, :self.samples] = self.occupancy[:, :self.samples]
+        self.occupancy = occupancy
@@ -0,0 +1,3 @@
+"""
+Benchmarks package. Run modules directly, e.g. `python -m benchmarks.tick_scaling`.
+"""
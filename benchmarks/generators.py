@@ -0,0 +1,72 @@
+"""
+Synthetic topologies and subscriber populations in config.yaml format.
+
+Generators return plain dicts, so the same output feeds simulation.build_network,
+the sweep layouts (simulation.sweep) and the benchmark suite.
+"""
+import math
+import random
+from equipment.constants import CITY_SIZE
+from base_station.constants import DEFAULT_CAPACITY
+
+FREQUENCY = 1800
+BANDWIDTH = 5
+ANTENNA_TYPE = "omni"
+INITIAL_BALANCE = 10**9
+
+
+def base_station_entry(index, x, y, capacity=DEFAULT_CAPACITY):
+    return {'id': f"BS-{index:04d}", 'x': float(x), 'y': float(y), 'capacity': capacity,
+            'frequency': FREQUENCY, 'bandwidth': BANDWIDTH, 'antenna_type': ANTENNA_TYPE}
+
+
+def hex_layout(cells, size=CITY_SIZE, capacity=DEFAULT_CAPACITY):
+    """
+    `cells` sites on a hexagonal grid covering a size x size square
+    (rows offset by half a spacing; row pitch is spacing * sqrt(3) / 2).
+    """
+    # Pick the spacing that fits roughly `cells` sites, then trim the surplus
+    spacing = size * math.sqrt(2 / (math.sqrt(3) * cells))
+    pitch = spacing * math.sqrt(3) / 2
+    stations = []
+    row = 0
+    while len(stations) < cells:
+        y = pitch / 2 + row * pitch
+        offset = spacing / 2 if row % 2 else 0.0
+        x = spacing / 4 + offset
+        while x <= size and len(stations) < cells:
+            stations.append(base_station_entry(len(stations), min(x, size), min(y, size), capacity))
+            x += spacing
+        row += 1
+    return stations
+
+
+def random_layout(cells, size=CITY_SIZE, capacity=DEFAULT_CAPACITY, seed=0):
+    """`cells` sites uniformly scattered over a size x size square."""
+    rng = random.Random(seed)
+    return [base_station_entry(i, rng.uniform(0, size), rng.uniform(0, size), capacity) for i in range(cells)]
+
+
+def population(subscribers, balance=INITIAL_BALANCE):
+    """`subscribers` funded subscriber entries with unique ids and phones."""
+    return [
+        {'id': f"UE-{i}", 'name': "Sub", 'surname': str(i), 'phone': f"7{i:09d}",
+         'email': f"sub{i}@example.com", 'initial_balance': balance}
+        for i in range(subscribers)
+    ]
+
+
+LAYOUTS = {"hex": hex_layout, "random": random_layout}
+
+
+def synthetic_config(cells, subscribers, layout="hex", arrival_rate=0.002, avg_duration=60, **simulation):
+    """Full config dict (tariffs, base stations, subscribers) ready for simulation.build_network."""
+    sim_config = {'duration_seconds': 3600, 'arrival_rate': arrival_rate, 'avg_duration': avg_duration,
+                  'events': []}
+    sim_config.update(simulation)
+    return {
+        'simulation': sim_config,
+        'tariffs': [{'id': "basic_01", 'name': "Basic", 'price_per_minute': 1}],
+        'base_stations': LAYOUTS[layout](cells),
+        'subscribers': population(subscribers),
+    }
@@ -0,0 +1,105 @@
+"""
+Import-time guard for the CLI entry points: startup cost and import side effects.
+
+Each module is imported in a fresh interpreter whose working directory is an empty
+temporary directory, so an import that reads config.yaml (or any relative path) fails.
+Heavy optional modules (matplotlib, pyarrow) must not be loaded by the import.
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --save import_baseline.json
+    python -m benchmarks.import_time --baseline import_baseline.json --tolerance 0.25
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+MODULES = ("network", "simulation", "main")
+FORBIDDEN = ("matplotlib", "pyarrow")
+REPEATS = 5
+DEFAULT_TOLERANCE = 0.25
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {forbidden!r} if m in sys.modules]}}))
+"""
+
+
+def probe(module, cwd):
+    """Import `module` in a fresh interpreter; returns (seconds, forbidden modules loaded, error)."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, (ROOT, os.environ.get("PYTHONPATH")))))
+    completed = subprocess.run([sys.executable, "-c", PROBE.format(module=module, forbidden=FORBIDDEN)],
+                               cwd=cwd, env=env, capture_output=True, text=True)
+    if completed.returncode:
+        return None, [], completed.stderr.strip().splitlines()[-1]
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    return result["seconds"], result["loaded"], None
+
+
+def measure(modules=MODULES, repeats=REPEATS):
+    """{module: {"seconds": best of repeats, "loaded": [...], "error": str | None}}."""
+    results = {}
+    with tempfile.TemporaryDirectory() as cwd:
+        for module in modules:
+            runs = [probe(module, cwd) for _ in range(repeats)]
+            times = [seconds for seconds, _, _ in runs if seconds is not None]
+            results[module] = {
+                "seconds": min(times) if times else None,
+                "loaded": sorted({name for _, loaded, _ in runs for name in loaded}),
+                "error": next((error for _, _, error in runs if error), None),
+            }
+    return results
+
+
+def check(results, baseline=None, tolerance=DEFAULT_TOLERANCE):
+    """Problems found: import errors, forbidden modules, slowdowns beyond tolerance vs baseline."""
+    problems = []
+    for module, result in results.items():
+        if result["error"]:
+            problems.append(f"{module}: import failed outside the repo directory ({result['error']})")
+        if result["loaded"]:
+            problems.append(f"{module}: loads {', '.join(result['loaded'])} at import")
+        reference = (baseline or {}).get(module, {}).get("seconds")
+        if reference and result["seconds"] and result["seconds"] > reference * (1 + tolerance):
+            problems.append(f"{module}: {result['seconds'] * 1000:.0f} ms vs baseline {reference * 1000:.0f} ms")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("modules", nargs="*", help=f"modules to import (default: {', '.join(MODULES)})")
+    parser.add_argument("--repeats", type=int, default=REPEATS)
+    parser.add_argument("--save", help="write results JSON (use as a future baseline)")
+    parser.add_argument("--baseline", help="compare against this results JSON")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed relative slowdown vs baseline (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    results = measure(args.modules or MODULES, args.repeats)
+    print(f"{'Модуль':>12} | {'мс':>8} | Лишние модули")
+    print("-" * 40)
+    for module, result in results.items():
+        seconds = f"{result['seconds'] * 1000:8.1f}" if result["seconds"] is not None else f"{'ошибка':>8}"
+        print(f"{module:>12} | {seconds} | {', '.join(result['loaded']) or '-'}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    problems = check(results, baseline, args.tolerance)
+    for problem in problems:
+        print("REGRESSION:", problem)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""
+Retained bytes per domain object (subscriber with its UE and trajectory store, BaseStation,
+CallSession, Tariff), measured with tracemalloc over a large population.
+
+Subscribers are built like simulation.builder does, from freshly parsed strings, so the
+figures include what id/name interning and the shared Tariff save.
+"""
+import random
+import sys
+import tracemalloc
+from tariff import Tariff
+from base_station import BaseStation
+from session.core import CallSession
+from subscriber import Subscriber
+from equipment import UserEquipment
+from utils import intern_id
+
+COUNT = 100_000
+FIRST_NAMES = ("Иван", "Пётр", "Анна", "Мария", "Олег")
+LAST_NAMES = ("Иванов", "Петров", "Смирнова", "Кузнецова", "Попов")
+
+
+def parsed(value):
+    """A new str object equal to value, as yaml.safe_load returns for every scalar."""
+    return value.encode().decode()
+
+
+def measure(factory, count=COUNT):
+    """Average traced bytes per object kept alive after factory(i) for i in range(count)."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(i) for i in range(count)]
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del objects
+    return allocated / count
+
+
+def main(count=COUNT):
+    random.seed(0)
+    tariffs = {"Basic": Tariff("Basic", 1)}
+    base_station = BaseStation("BS-01", 100, 500, 500, 1800, 5, "omni")
+
+    def subscriber(i):
+        ue = UserEquipment(intern_id(parsed(f"UE-{i}")), 0, 0)
+        phone = intern_id(parsed(str(7_000_000_000 + i)))
+        sub = Subscriber(intern_id(parsed(FIRST_NAMES[i % 5])), intern_id(parsed(LAST_NAMES[i % 5])), phone, ue,
+                         intern_id(parsed("user@example.com")), phone, tariffs["Basic"], 0.002, 60)
+        sub.top_up(100)
+        return sub
+
+    rows = (
+        ("Абонент (Subscriber + UE + траектория)", measure(subscriber, count)),
+        ("UserEquipment", measure(lambda i: UserEquipment(i, 0, 0), count)),
+        ("BaseStation", measure(lambda i: BaseStation(i, 100, 0, 0, 1800, 5, "omni"), count)),
+        ("CallSession", measure(lambda i: CallSession(None, base_station, 60, 0.0), count)),
+        ("Tariff", measure(lambda i: Tariff("Basic", 1), count)),
+    )
+    print(f"{'Объект':>40} | {'байт':>8}")
+    print("-" * 52)
+    for name, size in rows:
+        print(f"{name:>40} | {size:>8.0f}")
+    print(f"Оценка на 1 млн абонентов: {rows[0][1] * 1e6 / 2**30:.2f} ГиБ")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else COUNT)
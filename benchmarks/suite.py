@@ -0,0 +1,182 @@
+"""
+Benchmark suite over synthetic topologies: tick throughput, MME selection and REM build.
+
+Each scenario runs in a fresh process so peak memory is per scenario.
+
+    python -m benchmarks.suite                      # quick scenarios
+    python -m benchmarks.suite tick-10k-500         # named scenarios
+    python -m benchmarks.suite --save baseline.json
+    python -m benchmarks.suite --baseline baseline.json --tolerance 0.15
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource
+except ImportError:  # not available on Windows; peak memory is then not reported
+    resource = None
+
+from .generators import synthetic_config
+from .tick_scaling import time_ticks
+
+SCENARIOS = {
+    "tick-1k-50": {"kind": "tick", "cells": 50, "subscribers": 1_000, "ticks": 300},
+    "tick-1k-50-vectorized": {"kind": "tick", "cells": 50, "subscribers": 1_000, "ticks": 300,
+                              "engine": "vectorized"},
+    "tick-10k-500": {"kind": "tick", "cells": 500, "subscribers": 10_000, "ticks": 3600},
+    "tick-10k-500-vectorized": {"kind": "tick", "cells": 500, "subscribers": 10_000, "ticks": 3600,
+                                "engine": "vectorized"},
+    "tick-10k-500-random": {"kind": "tick", "cells": 500, "subscribers": 10_000, "ticks": 3600,
+                            "layout": "random"},
+    "mme-500": {"kind": "mme", "cells": 500, "subscribers": 1_000, "calls": 5_000},
+    "rem-500": {"kind": "rem", "cells": 500, "resolution": 2},
+}
+QUICK = ("tick-1k-50", "tick-1k-50-vectorized", "mme-500", "rem-500")
+DEFAULT_TOLERANCE = 0.10
+SEED = 0
+
+
+def peak_memory_mb():
+    if resource is None:
+        return None
+    # ru_maxrss is kilobytes on Linux, bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 2**20
+
+
+def build(scenario):
+    from simulation import build_network
+
+    random.seed(SEED)
+    config = synthetic_config(scenario['cells'], scenario.get('subscribers', 0), scenario.get('layout', "hex"),
+                              engine=scenario.get('engine', "object"))
+    started = time.perf_counter()
+    network = build_network(config)
+    return network, time.perf_counter() - started
+
+
+def bench_tick(scenario):
+    network, build_s = build(scenario)
+    ticks = scenario['ticks']
+    elapsed = time_ticks(network, ticks)
+    return {
+        "build_s": build_s,
+        "seconds": elapsed,
+        "ticks_per_s": ticks / elapsed,
+        "ue_ticks_per_s": ticks * len(network.subscribers) / elapsed,
+        "active_sessions": len(network.active_sessions),
+    }
+
+
+def bench_mme(scenario):
+    network, build_s = build(scenario)
+    subscribers = list(network.subscribers.values())
+    rng = random.Random(SEED)
+    picks = [rng.choice(subscribers) for _ in range(scenario['calls'])]
+    started = time.perf_counter()
+    for sub in picks:
+        network.mme.select_best_base_station(sub, network.base_stations.values())
+    elapsed = time.perf_counter() - started
+    return {"build_s": build_s, "seconds": elapsed, "selections_per_s": len(picks) / elapsed}
+
+
+def bench_rem(scenario):
+    from network.rem.core import CoverageMap
+    from equipment.constants import CITY_SIZE
+
+    network, build_s = build(scenario)
+    coverage = CoverageMap(CITY_SIZE, CITY_SIZE, network.base_stations, scenario['resolution'])
+    started = time.perf_counter()
+    coverage.update_coverage_map()
+    elapsed = time.perf_counter() - started
+    pixels = coverage.shape[0] * coverage.shape[1]
+    return {"build_s": build_s, "seconds": elapsed, "pixels_per_s": pixels / elapsed,
+            "cell_pixels_per_s": pixels * len(network.base_stations) / elapsed}
+
+
+BENCHES = {"tick": bench_tick, "mme": bench_mme, "rem": bench_rem}
+
+
+def run_scenario(name):
+    """Run one scenario in this process and return its metrics."""
+    scenario = SCENARIOS[name]
+    result = BENCHES[scenario['kind']](scenario)
+    result["peak_rss_mb"] = peak_memory_mb()
+    return result
+
+
+def run_suite(names=QUICK):
+    """{scenario: metrics}, every scenario in its own worker process."""
+    results = {}
+    for name in names:
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            results[name] = pool.submit(run_scenario, name).result()
+    return results
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    Regressions against a stored baseline: any *_per_s metric more than `tolerance`
+    below baseline, or peak_rss_mb more than `tolerance` above it.
+    Returns a list of (scenario, metric, baseline, current, ratio).
+    """
+    regressions = []
+    for name, metrics in results.items():
+        for metric, reference in baseline.get(name, {}).items():
+            current = metrics.get(metric)
+            if current is None or not reference:
+                continue
+            ratio = current / reference
+            if metric.endswith("_per_s") and ratio < 1 - tolerance:
+                regressions.append((name, metric, reference, current, ratio))
+            elif metric == "peak_rss_mb" and ratio > 1 + tolerance:
+                regressions.append((name, metric, reference, current, ratio))
+    return regressions
+
+
+def print_results(results, baseline=None):
+    print(f"{'Сценарий':>24} | {'Метрика':>18} | {'Значение':>14} | {'База':>14} | {'Δ':>7}")
+    print("-" * 90)
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            if value is None or not (metric.endswith("_per_s") or metric in ("peak_rss_mb", "seconds")):
+                continue
+            reference = (baseline or {}).get(name, {}).get(metric)
+            delta = f"{value / reference - 1:+.1%}" if reference else ""
+            reference = f"{reference:>14.1f}" if reference else " " * 14
+            print(f"{name:>24} | {metric:>18} | {value:>14.1f} | {reference} | {delta:>7}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("scenarios", nargs="*", help=f"any of: {', '.join(SCENARIOS)} (default: quick set)")
+    parser.add_argument("--save", help="write results JSON (use as a future baseline)")
+    parser.add_argument("--baseline", help="compare against this results JSON")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.scenarios or QUICK)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if baseline:
+        regressions = compare(results, baseline, args.tolerance)
+        for name, metric, reference, current, ratio in regressions:
+            print(f"РЕГРЕССИЯ {name}.{metric}: {reference:.1f} -> {current:.1f} ({ratio - 1:+.1%})")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
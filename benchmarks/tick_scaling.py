@@ -0,0 +1,57 @@
+"""
+Tick cost vs subscriber count. With the O(1) session index the per-subscriber
+cost should stay flat (linear total cost) as the population grows.
+"""
+import contextlib
+import os
+import random
+import time
+from tariff import Tariff
+from network import Network
+from base_station import BaseStation
+from subscriber import Subscriber
+from equipment import UserEquipment
+from simulation import run_ticks
+
+POPULATIONS = (1_000, 2_000, 4_000, 8_000)
+TICKS = 100
+ARRIVAL_RATE = 0.01
+AVG_DURATION = 60
+
+
+def build_network(subscriber_count, seed=0):
+    """Three-cell network with subscriber_count funded subscribers."""
+    random.seed(seed)
+    network = Network()
+    tariff = Tariff("Basic", 1)
+    for bs_id, x, y in (("BS-01", 500, 500), ("BS-02", 300, 300), ("BS-03", 700, 700)):
+        network.add_base_station(BaseStation(bs_id, subscriber_count, x, y, 1800, 5, "omni"))
+    for i in range(subscriber_count):
+        ue = UserEquipment(f"UE-{i}", 0, 0)
+        sub = Subscriber("Sub", str(i), str(i), ue, "", str(i), tariff, ARRIVAL_RATE, AVG_DURATION)
+        sub.top_up(10**9)
+        network.add_subscriber(sub)
+    return network
+
+
+def time_ticks(network, ticks=TICKS):
+    """Seconds spent on `ticks` seconds of run_ticks (acts, retrials, tick), console output suppressed."""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        started = time.perf_counter()
+        run_ticks(network, ticks + 1, progress=False)
+        return time.perf_counter() - started
+
+
+def main():
+    print(f"{'Абоненты':>10} | {'Сессии':>7} | {'мс/тик':>8} | {'мкс/абонент·тик':>16}")
+    print("-" * 52)
+    for count in POPULATIONS:
+        network = build_network(count)
+        elapsed = time_ticks(network)
+        per_tick_ms = elapsed / TICKS * 1e3
+        per_sub_us = elapsed / (TICKS * count) * 1e6
+        print(f"{count:>10} | {len(network.active_sessions):>7} | {per_tick_ms:>8.2f} | {per_sub_us:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
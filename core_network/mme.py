@@ -14,7 +14,7 @@ class MME:
         """
         candidates = []
         
-        for base_station in self.network.base_stations.values():
+        for base_station in self.network.nearby_base_stations(subscriber.user_equipment):
             is_good_link, rsrp = self.network.check_connection_quality(subscriber, base_station)
             if is_good_link:
                 candidates.append((rsrp, base_station))
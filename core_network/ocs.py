@@ -14,3 +14,8 @@ class OCS:
         subscriber.withdraw(amount)
         return subscriber.get_balance()
 
+    def charge_subscribers(self, charges):
+        """Bulk charging: charges maps subscriber -> amount."""
+        for subscriber, amount in charges.items():
+            subscriber.withdraw(amount)
+
@@ -3,4 +3,9 @@ User Equipment constants.
 """
 TX_POWER = 23
 RX_SENSITIVITY = -110
-
+CITY_SIZE = 1000
+TRAJECTORY_MAX_SAMPLES = 3600
+TRAJECTORY_EVERY = 1
+TRAJECTORY_INITIAL_CAPACITY = 64
+# UEStateStore rows allocated up front (grown by doubling)
+STATE_INITIAL_CAPACITY = 1024
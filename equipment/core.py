@@ -2,28 +2,62 @@
 User Equipment module.
 """
 import random
-from .constants import TX_POWER, RX_SENSITIVITY
+from .constants import TX_POWER, RX_SENSITIVITY, CITY_SIZE
+from .trajectory import TrajectoryStore
 
 
 class UserEquipment:
+    __slots__ = ('ue_id', '_position', '_velocity', 'state_index', 'tx_power', 'rx_sensitivity', 'trajectory')
+
     def __init__(self, ue_id, location_x, location_y):
         self.ue_id = ue_id
-        self.location_x = random.randint(0, 1000)
-        self.location_y = random.randint(0, 1000)
-        self.velocity_x = random.uniform(-1, 1)
-        self.velocity_y = random.uniform(-1, 1)
+        self._position = [random.randint(0, CITY_SIZE), random.randint(0, CITY_SIZE)]
+        self._velocity = [random.uniform(-1, 1), random.uniform(-1, 1)]
+        self.state_index = None
         self.tx_power = TX_POWER
         self.rx_sensitivity = RX_SENSITIVITY
-        self.history = []
+        self.trajectory = TrajectoryStore()
+
+    def bind(self, position, velocity, state_index):
+        """Back position/velocity by rows of a UEStateStore (see equipment/state.py)."""
+        self._position = position
+        self._velocity = velocity
+        self.state_index = state_index
+
+    @property
+    def location_x(self):
+        return self._position[0]
+
+    @location_x.setter
+    def location_x(self, value):
+        self._position[0] = value
+
+    @property
+    def location_y(self):
+        return self._position[1]
+
+    @location_y.setter
+    def location_y(self, value):
+        self._position[1] = value
+
+    @property
+    def velocity_x(self):
+        return self._velocity[0]
+
+    @velocity_x.setter
+    def velocity_x(self, value):
+        self._velocity[0] = value
+
+    @property
+    def velocity_y(self):
+        return self._velocity[1]
+
+    @velocity_y.setter
+    def velocity_y(self, value):
+        self._velocity[1] = value
 
     def log_state(self, timestamp, rsrp, base_station_id):
-        self.history.append({
-            'time': timestamp,
-            'x': self.location_x,
-            'y': self.location_y,
-            'rsrp': rsrp,
-            'base_station_id': base_station_id
-        })
+        self.trajectory.append(timestamp, self.location_x, self.location_y, rsrp, base_station_id)
 
     def get_id(self):
         return self.ue_id
@@ -32,22 +66,31 @@ class UserEquipment:
         return self.location_x, self.location_y
    
     def move(self):
-        self.location_x += self.velocity_x
-        self.location_y += self.velocity_y
+        position, velocity = self._position, self._velocity
+        position[0] += velocity[0]
+        position[1] += velocity[1]
         
-        if self.location_x < 0 or self.location_x > 1000:
-            self.velocity_x *= -1
-        if self.location_y < 0 or self.location_y > 1000:
-            self.velocity_y *= -1
+        if position[0] < 0 or position[0] > CITY_SIZE:
+            velocity[0] *= -1
+        if position[1] < 0 or position[1] > CITY_SIZE:
+            velocity[1] *= -1
+
+    def advance(self, seconds):
+        """Closed-form move over `seconds` with mirror reflection at the city borders."""
+        for axis in (0, 1):
+            phase = (self._position[axis] + self._velocity[axis] * seconds) % (2 * CITY_SIZE)
+            if phase > CITY_SIZE:
+                phase = 2 * CITY_SIZE - phase
+                self._velocity[axis] *= -1
+            self._position[axis] = phase
 
     def generate_measurement_report(self, network, subscriber):
         """Returns list of visible base stations and their RSRP."""
         report = []
-        for bs in network.base_stations.values():
+        for bs in network.nearby_base_stations(self):
             _, rsrp = network.check_connection_quality(subscriber, bs)
             if rsrp > self.rx_sensitivity:
                 report.append({'bs_id': bs.id, 'rsrp': rsrp, 'bs_object': bs})
         
         report.sort(key=lambda x: x['rsrp'], reverse=True)
         return report
-
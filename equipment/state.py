@@ -0,0 +1,43 @@
+"""
+Array-backed UE state storage for the vectorized tick engine.
+"""
+import numpy as np
+from .constants import CITY_SIZE, STATE_INITIAL_CAPACITY
+
+
+class UEStateStore:
+    """Struct-of-arrays store: one row of position/velocity per registered UE."""
+
+    def __init__(self, capacity=STATE_INITIAL_CAPACITY):
+        self.size = 0
+        self.position = np.zeros((capacity, 2))
+        self.velocity = np.zeros((capacity, 2))
+        self.user_equipments = []
+
+    def register(self, user_equipment):
+        """Copy UE state into the arrays and bind the UE to its rows. Returns row index."""
+        if self.size == len(self.position):
+            self._grow()
+        index = self.size
+        self.position[index] = user_equipment.get_location()
+        self.velocity[index] = (user_equipment.velocity_x, user_equipment.velocity_y)
+        self.user_equipments.append(user_equipment)
+        self.size += 1
+        user_equipment.bind(self.position[index], self.velocity[index], index)
+        return index
+
+    def move(self, bounds=CITY_SIZE):
+        """Vectorized UserEquipment.move(): step every UE and reflect at city borders."""
+        position = self.position[:self.size]
+        velocity = self.velocity[:self.size]
+        position += velocity
+        outside = (position < 0) | (position > bounds)
+        velocity[outside] *= -1
+
+    def _grow(self):
+        """Double capacity; UEs are rebound because their row views go stale."""
+        capacity = 2 * len(self.position)
+        self.position = np.resize(self.position, (capacity, 2))
+        self.velocity = np.resize(self.velocity, (capacity, 2))
+        for index, user_equipment in enumerate(self.user_equipments):
+            user_equipment.bind(self.position[index], self.velocity[index], index)
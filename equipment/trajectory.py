@@ -0,0 +1,95 @@
+"""
+Bounded, array-backed UE trajectory history.
+"""
+import os
+import numpy as np
+from utils import Interner
+from .constants import TRAJECTORY_MAX_SAMPLES, TRAJECTORY_EVERY, TRAJECTORY_INITIAL_CAPACITY
+
+SAMPLE_DTYPE = np.dtype([('time', 'f8'), ('x', 'f8'), ('y', 'f8'), ('rsrp', 'f8'), ('cell', 'i4')])
+# Shared by all stores: cell codes mean the same cell in every trajectory, and a store only
+# allocates its own ring on the first retained sample (_grow never writes into EMPTY_RING)
+CELL_IDS = Interner()
+EMPTY_RING = np.empty(0, dtype=SAMPLE_DTYPE)
+
+
+class TrajectoryStore:
+    """
+    Retention policy: keep every `every`-th logged sample, at most `max_samples`
+    of them in RAM; with spill_path every evicted window is appended to disk
+    (a file left at spill_path by an earlier run is removed on construction).
+    Once full, the ring is stored twice back to back so the retained window is
+    always one contiguous slice: view() is zero-copy.
+    """
+    __slots__ = ('max_samples', 'every', 'spill_path', 'cell_ids', 'ring', 'logged', 'count', 'spilled')
+
+    def __init__(self, max_samples=TRAJECTORY_MAX_SAMPLES, every=TRAJECTORY_EVERY, spill_path=None):
+        self.max_samples = max_samples
+        self.every = every
+        self.spill_path = spill_path
+        if spill_path and os.path.exists(spill_path):
+            os.remove(spill_path)
+        self.cell_ids = CELL_IDS
+        self.ring = EMPTY_RING
+        self.logged = 0
+        self.count = 0
+        self.spilled = 0
+
+    def append(self, timestamp, x, y, rsrp, base_station_id):
+        self.logged += 1
+        if (self.logged - 1) % self.every:
+            return
+        sample = (timestamp, x, y, rsrp, self.cell_ids.intern(base_station_id))
+        if self.count < self.max_samples:
+            if self.count == len(self.ring):
+                self._grow()
+            self.ring[self.count] = sample
+        else:
+            if self.count == self.max_samples:
+                self._start_ring()
+            if self.spill_path and self.count % self.max_samples == 0:
+                self._spill()
+            position = self.count % self.max_samples
+            self.ring[position] = self.ring[position + self.max_samples] = sample
+        self.count += 1
+
+    def view(self):
+        """Retained samples, oldest first, as a structured-array view (fields: time, x, y, rsrp, cell)."""
+        if self.count <= self.max_samples:
+            return self.ring[:self.count]
+        start = self.count % self.max_samples
+        return self.ring[start:start + self.max_samples]
+
+    def base_station_ids(self, cells):
+        """Decode cell indices from view()['cell'] back to base station ids."""
+        return [self.cell_ids.lookup(cell) for cell in cells]
+
+    def load_all(self):
+        """Spilled history plus the unspilled tail (a copy); equals view() without spill_path."""
+        if not self.spilled:
+            return self.view()
+        on_disk = np.fromfile(self.spill_path, dtype=SAMPLE_DTYPE)
+        retained = self.view()
+        tail = self.count - self.spilled
+        return np.concatenate((on_disk, retained[len(retained) - tail:]))
+
+    def __len__(self):
+        return min(self.count, self.max_samples)
+
+    def _grow(self):
+        capacity = min(self.max_samples, max(TRAJECTORY_INITIAL_CAPACITY, 2 * len(self.ring)))
+        ring = np.empty(capacity, dtype=SAMPLE_DTYPE)
+        ring[:self.count] = self.ring[:self.count]
+        self.ring = ring
+
+    def _start_ring(self):
+        """Switch to the mirrored 2N layout on the first overwrite."""
+        ring = np.empty(2 * self.max_samples, dtype=SAMPLE_DTYPE)
+        ring[:self.max_samples] = ring[self.max_samples:] = self.ring[:self.max_samples]
+        self.ring = ring
+
+    def _spill(self):
+        """Append the window about to be overwritten to spill_path."""
+        with open(self.spill_path, "ab") as f:
+            self.view().tofile(f)
+        self.spilled = self.count
@@ -0,0 +1,8 @@
+"""
+Events module public API.
+"""
+from .core import Event, EventBus
+from .sinks import NullSink, CounterSink, JsonlSink, ConsoleSink
+from . import constants as EventType
+
+__all__ = ['Event', 'EventBus', 'EventType', 'NullSink', 'CounterSink', 'JsonlSink', 'ConsoleSink']
@@ -0,0 +1,28 @@
+"""
+Event types and sink settings.
+"""
+HANDOVER = "HANDOVER"
+DROP = "DROP"
+BLOCK_CAPACITY = "BLOCK_CAPACITY"
+BLOCK_BALANCE = "BLOCK_BALANCE"
+RETRY = "RETRY"
+COMPLETE = "COMPLETE"
+EVENT_TYPES = (HANDOVER, DROP, BLOCK_CAPACITY, BLOCK_BALANCE, RETRY, COMPLETE)
+
+SINK_NULL = "null"
+SINK_COUNTER = "counter"
+SINK_JSONL = "jsonl"
+SINK_CONSOLE = "console"
+DEFAULT_EVENT_LOG = "events.jsonl"
+DEFAULT_BUFFER_SIZE = 10_000
+
+# Console lines; COMPLETE has a template but is off by default (one line per call is too chatty)
+CONSOLE_TEMPLATES = {
+    HANDOVER: "🔄 [HANDOVER] {name}: {source} -> {target}",
+    DROP: "❌ [DROPPED] {name} потерял сеть в точке ({x:.1f}, {y:.1f})",
+    BLOCK_CAPACITY: "Вышка перегружена",
+    BLOCK_BALANCE: "Недостаточно денег на балансе: нужно {cost} руб., на балансе {balance} руб.",
+    RETRY: "--- {name} делает ПОВТОРНУЮ попытку ---",
+    COMPLETE: "✅ [COMPLETED] {name}: {duration} с на {cell}",
+}
+CONSOLE_DEFAULT_KINDS = (HANDOVER, DROP, BLOCK_CAPACITY, BLOCK_BALANCE, RETRY)
@@ -0,0 +1,55 @@
+"""
+Event bus: typed simulation events fanned out to pluggable sinks.
+"""
+
+
+class Event:
+    """One simulation event. subscriber is the Subscriber object, cell a base station id."""
+    __slots__ = ('kind', 'time', 'subscriber', 'cell', 'data')
+
+    def __init__(self, kind, time, subscriber=None, cell=None, data=None):
+        self.kind = kind
+        self.time = time
+        self.subscriber = subscriber
+        self.cell = cell
+        self.data = data
+
+    def to_dict(self):
+        row = {"kind": self.kind, "time": self.time,
+               "subscriber": self.subscriber.id_number if self.subscriber is not None else None,
+               "cell": self.cell}
+        if self.data:
+            row.update(self.data)
+        return row
+
+    def __repr__(self):
+        return f"Event({self.to_dict()!r})"
+
+
+class EventBus:
+    """
+    Publishes events to every attached sink. With no sinks (the default) publish
+    returns before building the Event, so a silent batch run pays one call per event.
+    """
+
+    def __init__(self, sinks=None):
+        self.sinks = list(sinks) if sinks else []
+
+    def attach(self, sink):
+        self.sinks.append(sink)
+        return sink
+
+    def publish(self, kind, time, subscriber=None, cell=None, **data):
+        if not self.sinks:
+            return
+        event = Event(kind, time, subscriber, cell, data)
+        for sink in self.sinks:
+            sink.handle(event)
+
+    def flush(self):
+        for sink in self.sinks:
+            sink.flush()
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
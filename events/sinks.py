@@ -0,0 +1,70 @@
+"""
+Event sinks: drop, count, buffered JSONL file or human-readable console lines.
+"""
+import json
+from .constants import CONSOLE_TEMPLATES, CONSOLE_DEFAULT_KINDS, DEFAULT_BUFFER_SIZE
+
+
+class NullSink:
+    """Discards everything."""
+
+    def handle(self, event):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class CounterSink(NullSink):
+    """Counts events per kind."""
+
+    def __init__(self):
+        self.counts = {}
+
+    def handle(self, event):
+        self.counts[event.kind] = self.counts.get(event.kind, 0) + 1
+
+    def __getitem__(self, kind):
+        return self.counts.get(kind, 0)
+
+
+class JsonlSink(NullSink):
+    """Appends one JSON object per event to path, writing buffer_size lines at a time."""
+
+    def __init__(self, path, buffer_size=DEFAULT_BUFFER_SIZE):
+        self.path = path
+        self.buffer_size = buffer_size
+        self.buffer = []
+        self.file = open(path, 'w', encoding='utf-8')
+
+    def handle(self, event):
+        self.buffer.append(json.dumps(event.to_dict(), ensure_ascii=False))
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self.file.write("\n".join(self.buffer) + "\n")
+            self.buffer.clear()
+        self.file.flush()
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+
+class ConsoleSink(NullSink):
+    """Prints the classic one-line messages for the selected kinds."""
+
+    def __init__(self, kinds=CONSOLE_DEFAULT_KINDS):
+        self.kinds = frozenset(kinds)
+
+    def handle(self, event):
+        if event.kind not in self.kinds:
+            return
+        name = event.subscriber.first_name if event.subscriber is not None else ""
+        print(CONSOLE_TEMPLATES[event.kind].format(name=name, cell=event.cell, **(event.data or {})))
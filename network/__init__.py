@@ -2,6 +2,7 @@
 Network module public API.
 """
 from .core import Network
+from .options import NetworkOptions
 
-__all__ = ['Network']
+__all__ = ['Network', 'NetworkOptions']
 
@@ -0,0 +1,103 @@
+"""
+Batch call admission: one vectorized link-budget pass for a burst of attempts.
+"""
+import numpy as np
+from events.constants import BLOCK_CAPACITY, BLOCK_BALANCE
+from .physics import get_link_matrix
+from .profiling import MME_SELECT
+from .constants import ADMISSION_CHUNK
+
+
+class CellArrays:
+    """Base station positions and link parameters as arrays, in network.base_stations order."""
+
+    def __init__(self, base_stations):
+        self.stations = list(base_stations.values())
+        self.positions = np.array([(bs.location_x, bs.location_y) for bs in self.stations], dtype=float).reshape(-1, 2)
+        self.tx_power = np.array([bs.tx_power for bs in self.stations], dtype=float)
+        self.rx_sensitivity = np.array([bs.rx_sensitivity for bs in self.stations], dtype=float)
+
+
+def rank_candidates(network, subscribers, chunk_size=ADMISSION_CHUNK):
+    """
+    For each subscriber, column indices of cells with a good link, strongest first
+    (stable, like MME.select_best_base_station). Matrices are built chunk_size rows at a time.
+    """
+    ranked = []
+    for start in range(0, len(subscribers), chunk_size):
+        ranked.extend(_rank_chunk(network.get_cell_arrays(), subscribers[start:start + chunk_size]))
+    return ranked
+
+
+def _rank_chunk(cells, subscribers):
+    ues = [sub.user_equipment for sub in subscribers]
+    positions = np.array([(ue.location_x, ue.location_y) for ue in ues], dtype=float).reshape(-1, 2)
+    good, rsrp = get_link_matrix(
+        positions,
+        np.array([ue.tx_power for ue in ues], dtype=float),
+        np.array([ue.rx_sensitivity for ue in ues], dtype=float),
+        cells.positions, cells.tx_power, cells.rx_sensitivity,
+    )
+    order = np.argsort(np.where(good, -rsrp, np.inf), axis=1, kind='stable')
+    counts = good.sum(axis=1).tolist()
+    return [order[i, :count].tolist() for i, count in enumerate(counts)]
+
+
+def connect_calls(network, batch):
+    """
+    Admit batch = [(subscriber, duration, start_time), ...] in order.
+
+    Same outcome as calling network.connect_call for each request in turn: cells fill up
+    and balances drop as earlier requests are admitted. OCS charges are collected and
+    applied in one pass at the end (a subscriber's pending charge is applied early if it
+    requests again within the batch). Returns a list of bools.
+    """
+    if not batch:
+        return []
+    if network.physics == "raster" or not network.base_stations:
+        return [network.connect_call(*request) for request in batch]
+
+    started = network.profiler.start()
+    candidates = rank_candidates(network, [request[0] for request in batch])
+    network.profiler.stop(MME_SELECT, started)
+    stations = network.get_cell_arrays().stations
+
+    charges = {}
+    results = [_admit(network, request, [stations[c] for c in columns], charges)
+               for request, columns in zip(batch, candidates)]
+    network.ocs.charge_subscribers(charges)
+    return results
+
+
+def _admit(network, request, candidates, charges):
+    """
+    One connect_calls request against its ranked candidate cells, with Network.connect_call
+    accounting. The OCS charge is deferred into charges; returns True if admitted.
+    """
+    subscriber, duration, start_time = request
+    network.total_attempts += 1
+    if not network.hss.get_subscriber(subscriber.id_number):
+        network.blocked_calls += 1
+        return False
+
+    bs = next((bs for bs in candidates if bs.current_calls < bs.capacity), None)
+    if bs is None:
+        network.blocked_by_capacity += 1
+        network.events.publish(BLOCK_CAPACITY, start_time, subscriber)
+        return False
+
+    if subscriber in charges:
+        network.ocs.charge_subscriber(subscriber, charges.pop(subscriber))
+    estimated_cost = duration * subscriber.tariff.get_cost_per_minute()
+    session = bs.connect_call(subscriber, duration, start_time)
+    if not session:
+        network.blocked_by_balance += 1
+        network.events.publish(BLOCK_BALANCE, start_time, subscriber, bs.id,
+                               cost=estimated_cost, balance=subscriber.balance)
+        return False
+
+    charges[subscriber] = estimated_cost
+    network.active_sessions[session] = None
+    network.sessions_by_subscriber[subscriber] = session
+    network.total_successful_calls += 1
+    return True
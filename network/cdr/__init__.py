@@ -0,0 +1,8 @@
+"""
+CDR (Call Detail Record) module public API.
+"""
+from .core import CDRManager
+from .sink import MemoryCDRSink, FileCDRSink
+from .record import CDRRecord
+
+__all__ = ['CDRManager', 'MemoryCDRSink', 'FileCDRSink', 'CDRRecord']
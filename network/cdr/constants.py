@@ -0,0 +1,14 @@
+"""
+CDR constants.
+"""
+CDR_COLUMNS = ("record_id", "subscriber_id", "base_station_id", "start_time", "duration", "cost_fixed", "reason")
+DEFAULT_BATCH_SIZE = 10_000
+CHUNK_SIZE = 10_000
+FORMAT_ARROW = "arrow"
+FORMAT_CSV = "csv"
+TIME_BUCKET_SECONDS = 60
+# Costs are stored as integer kopecks so revenue totals are exact
+COST_SCALE = 100
+COMPLETED = "COMPLETED"
+DROPPED = "DROPPED"
+REASONS = (COMPLETED, DROPPED)
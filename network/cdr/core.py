@@ -0,0 +1,100 @@
+"""
+CDR (Call Detail Record) management module.
+"""
+import time
+from ..clock import SimulationClock
+from .sink import MemoryCDRSink
+from .index import CDRIndex
+from .record import CDRRecord, to_fixed
+from .constants import COST_SCALE
+
+
+class CDRManager:
+    def __init__(self, sink=None, clock=None):
+        self.sink = sink if sink is not None else MemoryCDRSink()
+        self.clock = clock if clock is not None else SimulationClock()
+        self.index = CDRIndex()
+        self.next_record_id = len(self.sink)
+
+    def close_session(self, session, reason):
+        """Record CDR entry and free base station capacity."""
+        cost = session.duration * session.subscriber.tariff.get_cost_per_minute()
+        # Monotonic record_id instead of subscriber_cell_second keys, which collided
+        record = CDRRecord(
+            self.next_record_id,
+            session.subscriber.id_number,
+            session.base_station.id,
+            session.start_time,
+            session.duration,
+            to_fixed(cost),
+            reason
+        )
+        self.next_record_id += 1
+        self.index.add(record)
+        self.sink.write(record)
+        session.base_station.current_calls -= 1
+
+    def by_subscriber(self, subscriber_id):
+        """CDRs of one subscriber (HSS id_number)."""
+        return self.query(subscriber_id=subscriber_id)
+
+    def by_cell(self, base_station_id):
+        """CDRs closed on one base station."""
+        return self.query(base_station_id=base_station_id)
+
+    def between(self, t0, t1):
+        """CDRs with t0 <= start_time <= t1."""
+        return self.query(t0=t0, t1=t1)
+
+    def query(self, subscriber_id=None, base_station_id=None, t0=None, t1=None):
+        """Combined filter answered from the indexes; records come back in write order."""
+        return self.sink.fetch(self.index.rows_matching(subscriber_id, base_station_id, t0, t1))
+
+    def revenue_by_cell(self):
+        return {cell: total / COST_SCALE for cell, total in self.index.revenue_fixed_by_cell.items()}
+
+    def drops_by_cell(self):
+        return dict(self.index.drops_by_cell)
+
+    def print_cdr_report(self):
+        """Print formatted CDR report."""
+        print("\n" + "="*85)
+        print(f"{'ID Абонента':<12} | {'Начало':<8} | {'Длит.':<6} | {'Стоимость':<8} | {'Вышка'}")
+        print("-" * 85)
+        
+        if not len(self.sink):
+            print("База CDR пуста.")
+        for chunk in self.sink.iter_chunks():
+            for record in chunk:
+                print(f"{record.subscriber_id:<12} | "
+                    f"{self.format_start_time(record.start_time):<8} | "
+                    f"{record.duration:<6} | "
+                    f"{record.cost:<8.2f} | "
+                    f"{record.base_station_id}")
+        print("="*85)
+
+    def audit_network_revenue(self):
+        """Audit total revenue from CDR records (streamed chunk by chunk)."""
+        total_fixed = 0
+        for chunk in self.sink.iter_chunks():
+            total_fixed += sum(record.cost_fixed for record in chunk)
+        total_cdr_sum = total_fixed / COST_SCALE
+        print(f"\n[АУДИТ] Общая выручка по CDR: {total_cdr_sum:.2f} руб.")
+        print(f"[АУДИТ] Количество записей: {len(self.sink)}")
+
+    def get_calls_by_phone(self, phone_number, subscriber_id=None):
+        """Get all calls for a phone number; subscriber_id is its HSS id (defaults to the number)."""
+        calls = self.by_subscriber(subscriber_id if subscriber_id is not None else phone_number)
+        
+        print(f"\nНайдено звонков для номера {phone_number}: {len(calls)}")
+        for c in calls:
+            print(f"  - Старт: {self.format_start_time(c.start_time)} сек, Длительность: {c.duration} сек, Списано: {c.cost} руб.")
+        return calls
+
+    def close(self):
+        """Flush and close the sink."""
+        self.sink.close()
+
+    def format_start_time(self, start_time):
+        """CDRs keep simulated seconds; wall-clock text is produced only for reports."""
+        return time.strftime('%H:%M:%S', time.localtime(self.clock.to_wall(start_time)))
@@ -0,0 +1,72 @@
+"""
+Secondary indexes and running aggregates over CDR row ids.
+"""
+from array import array
+from collections import defaultdict
+from .constants import TIME_BUCKET_SECONDS, DROPPED
+
+
+class CDRIndex:
+    """
+    Row ids by subscriber, by cell and by start-time bucket, plus per-cell
+    revenue / call / drop totals updated as each CDR is written.
+    """
+
+    def __init__(self, bucket_seconds=TIME_BUCKET_SECONDS):
+        self.bucket_seconds = bucket_seconds
+        self.by_subscriber = defaultdict(lambda: array('q'))
+        self.by_cell = defaultdict(lambda: array('q'))
+        self.by_bucket = defaultdict(lambda: array('q'))
+        self.start_times = array('d')
+        self.revenue_fixed_by_cell = defaultdict(int)
+        self.calls_by_cell = defaultdict(int)
+        self.drops_by_cell = defaultdict(int)
+
+    def add(self, record):
+        row = record.record_id
+        cell = record.base_station_id
+        self.by_subscriber[record.subscriber_id].append(row)
+        self.by_cell[cell].append(row)
+        self.by_bucket[self._bucket(record.start_time)].append(row)
+        self.start_times.append(record.start_time)
+        self.revenue_fixed_by_cell[cell] += record.cost_fixed
+        self.calls_by_cell[cell] += 1
+        if record.reason == DROPPED:
+            self.drops_by_cell[cell] += 1
+
+    def rows_between(self, t0=None, t1=None):
+        """Rows with t0 <= start_time <= t1 (open-ended if None), touching only covering buckets."""
+        if not self.by_bucket:
+            return []
+        low = float("-inf") if t0 is None else t0
+        high = float("inf") if t1 is None else t1
+        first = min(self.by_bucket) if t0 is None else self._bucket(t0)
+        last = max(self.by_bucket) if t1 is None else self._bucket(t1)
+        if last - first < len(self.by_bucket):
+            buckets = range(first, last + 1)
+        else:
+            buckets = sorted(b for b in self.by_bucket if first <= b <= last)
+
+        rows = []
+        for bucket in buckets:
+            rows.extend(r for r in self.by_bucket.get(bucket, ()) if low <= self.start_times[r] <= high)
+        return rows
+
+    def rows_matching(self, subscriber_id=None, base_station_id=None, t0=None, t1=None):
+        """Intersection of the requested filters, scanning the smallest candidate list only."""
+        candidates = []
+        if subscriber_id is not None:
+            candidates.append(self.by_subscriber.get(subscriber_id, ()))
+        if base_station_id is not None:
+            candidates.append(self.by_cell.get(base_station_id, ()))
+        if t0 is not None or t1 is not None:
+            candidates.append(self.rows_between(t0, t1))
+        if not candidates:
+            return list(range(len(self.start_times)))
+
+        candidates.sort(key=len)
+        others = [set(rows) for rows in candidates[1:]]
+        return sorted(r for r in candidates[0] if all(r in rows for rows in others))
+
+    def _bucket(self, start_time):
+        return int(start_time // self.bucket_seconds)
@@ -0,0 +1,37 @@
+"""
+Compact CDR record type.
+"""
+from .constants import CDR_COLUMNS, COST_SCALE
+
+
+class CDRRecord:
+    """One call detail record; cost is kept as fixed-point integer cost_fixed."""
+    __slots__ = CDR_COLUMNS
+
+    def __init__(self, record_id, subscriber_id, base_station_id, start_time, duration, cost_fixed, reason):
+        self.record_id = record_id
+        self.subscriber_id = subscriber_id
+        self.base_station_id = base_station_id
+        self.start_time = start_time
+        self.duration = duration
+        self.cost_fixed = cost_fixed
+        self.reason = reason
+
+    @property
+    def cost(self):
+        return self.cost_fixed / COST_SCALE
+
+    @classmethod
+    def from_mapping(cls, mapping):
+        return cls(*(mapping[column] for column in CDR_COLUMNS))
+
+    def __eq__(self, other):
+        return isinstance(other, CDRRecord) and all(
+            getattr(self, column) == getattr(other, column) for column in CDR_COLUMNS)
+
+    def __repr__(self):
+        return f"CDR({self.record_id}, {self.subscriber_id}, {self.base_station_id}, {self.cost:.2f}, {self.reason})"
+
+
+def to_fixed(cost):
+    return round(cost * COST_SCALE)
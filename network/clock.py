@@ -0,0 +1,28 @@
+"""
+Simulation clock shared by every network component.
+"""
+import time
+
+
+class SimulationClock:
+    """
+    Simulated seconds since the start of the run. Components read `now` instead of
+    calling time.time(), so runs are deterministic and can go as fast as the CPU allows.
+    Wall-clock time is derived (epoch + now) only when reports are rendered.
+    """
+
+    def __init__(self, epoch=None):
+        self.now = 0.0
+        self.epoch = time.time() if epoch is None else epoch
+
+    def advance(self, seconds=1):
+        self.now += seconds
+        return self.now
+
+    def set(self, now):
+        """Jump to an absolute simulated time (event-driven mode)."""
+        self.now = now
+
+    def to_wall(self, sim_time):
+        """Unix timestamp for a simulated time, for display only."""
+        return self.epoch + sim_time
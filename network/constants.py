@@ -0,0 +1,9 @@
+"""
+Network constants.
+"""
+# Requests per RSRP matrix in connect_calls (bounds memory to chunk x cells)
+ADMISSION_CHUNK = 4096
+# Blocked calls retry after randint(*DEFAULT_RETRIAL_DELAY) seconds unless the policy says otherwise
+DEFAULT_RETRIAL_DELAY = (5, 15)
+# Metres added to the search radius in GridIndex.query to absorb float rounding at the edge
+SEARCH_MARGIN = 1.0
@@ -1,70 +1,125 @@
 """
 Network core orchestration module.
 """
-import time
-from .physics import check_connection_quality
+from .clock import SimulationClock
+from .physics import check_connection_quality, get_coverage_radius
+from .spatial import GridIndex
+from .rem.lookup import RasterLinkBudget
 from .cdr import CDRManager
-from .reporting import get_report, print_subscriber_trace, plot_subscriber_movement
+from .engine import VectorizedTickEngine
+from .handover import HandoverTracker
+from .admission import CellArrays, connect_calls
+from .retrial import RetrialQueue, request_call, retry_call
+from .sessions import update_session, try_handover, settle_session, close_session
+from .options import NetworkOptions
+from .profiling import NullTimer, MOVE, MME_SELECT
+from .reporting import get_report, print_cell_report, print_subscriber_trace, plot_subscriber_movement
 from core_network import HSS, OCS, MME
+from base_station.state import CellStateStore
+from events import EventBus
+from events.constants import BLOCK_CAPACITY, BLOCK_BALANCE
+from equipment.constants import RX_SENSITIVITY as UE_RX_SENSITIVITY
 
 
 class Network:
-    def __init__(self):
+    def __init__(self, options=None, cdr_sink=None, clock=None, events=None, profiler=None, cell_state=None):
+        options = options if options is not None else NetworkOptions()
+        self.options = options
         self.base_stations = {}
+        self.cell_index = None
         self.subscribers = {}
-        self.active_sessions = []
+        # Ordered set (dict keys) of live sessions: admission order, O(1) removal in close_session
+        self.active_sessions = {}
+        self.sessions_by_subscriber = {}
         self.total_attempts = 0
         self.total_successful_calls = 0
         self.blocked_calls = 0
         self.blocked_by_balance = 0
         self.blocked_by_capacity = 0
+        self.dropped_calls = 0
+        self.completed_calls = 0
+        self.handovers = 0
         self.mme = MME(self)
         self.hss = HSS()
         self.ocs = OCS()
-        self.cdr_manager = CDRManager()
+        self.clock = clock if clock is not None else SimulationClock()
+        self.cdr_manager = CDRManager(cdr_sink, self.clock)
+        self.events = events if events is not None else EventBus()
+        self.profiler = profiler if profiler is not None else NullTimer()
+        self.cell_state = cell_state if cell_state is not None else CellStateStore()
+        self.retrials = RetrialQueue(options.retry_policy)
+        self.cell_state.start_time = self.cell_state.time = self.clock.now
+        self.engine = VectorizedTickEngine(self) if options.engine == "vectorized" else None
+        # "full": sorted report every tick; "incremental": tracked neighbour + A3 events
+        self.handover = HandoverTracker(self, **options.handover_options) if options.handover == "incremental" else None
+        self.physics = options.physics
+        self.raster_resolution = options.raster_resolution
+        self.rem_cache = options.rem_cache
+        self.raster = None
+        self.cell_arrays = None
 
     def tick(self):
-        """Process one time tick: move UEs, handle sessions, handovers."""
+        """Process one time tick: advance the clock, move UEs, handle sessions, handovers."""
+        self.clock.advance(1)
+        self.cell_state.advance(self.clock.now)
+        if self.engine:
+            self.engine.tick()
+            self.profiler.end_tick()
+            return
+
+        started = self.profiler.start()
         for subscriber in self.subscribers.values():
             subscriber.user_equipment.move()
-            
-        still_active = []
-        for session in self.active_sessions:
-            session.remaining_time -= 1
-            ue = session.subscriber.user_equipment
-            source_bs = session.base_station
-            
-            mr = ue.generate_measurement_report(self, session.subscriber)
-            _, current_rsrp = check_connection_quality(session.subscriber, source_bs)
-            
-            target_bs = source_bs.evaluate_handover(current_rsrp, mr)
-            
-            if target_bs and target_bs.current_calls < target_bs.capacity:
-                print(f"🔄 [HANDOVER] {session.subscriber.first_name}: {source_bs.id} -> {target_bs.id}")
-                source_bs.current_calls -= 1
-                session.base_station = target_bs
-                target_bs.current_calls += 1
-                _, current_rsrp = check_connection_quality(session.subscriber, target_bs)
-
-            ue.log_state(time.time(), current_rsrp, session.base_station.id)
-
-            is_good_link = current_rsrp > ue.rx_sensitivity
-            
-            if not is_good_link:
-                print(f"❌ [DROPPED] {session.subscriber.first_name} потерял сеть в точке ({ue.location_x:.1f}, {ue.location_y:.1f})")
-                self.cdr_manager.close_session(session, "DROPPED")
-            elif session.remaining_time <= 0:
-                self.cdr_manager.close_session(session, "COMPLETED")
-            else:
-                still_active.append(session)
-
-        self.active_sessions = still_active
+        self.profiler.stop(MOVE, started)
+
+        for session in list(self.active_sessions):
+            self.update_session(session)
+        self.profiler.end_tick()
+
+    def update_session(self, session):
+        """Measurement, handover and drop/complete check (see sessions.py). Returns True if still active."""
+        return update_session(self, session)
+
+    def try_handover(self, session, target_bs):
+        """Move session to target_bs if it has free capacity. Returns True on handover."""
+        return try_handover(self, session, target_bs)
+
+    def settle_session(self, session, current_rsrp):
+        """Log UE state, then drop or complete the session. Returns True if it stays active."""
+        return settle_session(self, session, current_rsrp)
+
+    def close_session(self, session, reason):
+        """Write the CDR and remove the session (see sessions.py)."""
+        close_session(self, session, reason)
+
+    def find_session(self, subscriber):
+        """Active session of subscriber or None, O(1)."""
+        return self.sessions_by_subscriber.get(subscriber)
+
+    def is_busy(self, subscriber):
+        return subscriber in self.sessions_by_subscriber
 
     def add_base_station(self, base_station):
         self.base_stations[base_station.id] = base_station
+        self.raster = None
+        self.cell_arrays = None
+        self.cell_state.register(base_station)
+        if self.cell_index is None:
+            # Grid cell ~ coverage radius, so a query touches about 3x3 cells
+            self.cell_index = GridIndex(get_coverage_radius(base_station.tx_power, UE_RX_SENSITIVITY))
+        self.cell_index.add(base_station)
+
+    def nearby_base_stations(self, user_equipment):
+        """Cells that can possibly be heard by user_equipment, in base_stations order."""
+        if self.cell_index is None:
+            return []
+        radius = get_coverage_radius(self.cell_index.max_tx_power, user_equipment.rx_sensitivity)
+        return self.cell_index.query(user_equipment.location_x, user_equipment.location_y, radius)
 
     def add_subscriber(self, subscriber):
         self.subscribers[subscriber.phone] = subscriber
+        if self.engine:
+            self.engine.register(subscriber)
         self.hss.add_subscriber(subscriber.id_number, subscriber)
 
     def connect_call(self, subscriber, duration, start_time):
@@ -76,9 +131,12 @@ class Network:
             self.blocked_calls += 1
             return False
 
+        started = self.profiler.start()
         towers = self.mme.select_best_base_station(subscriber, self.base_stations.values())
+        self.profiler.stop(MME_SELECT, started)
         if not towers:
             self.blocked_by_capacity += 1
+            self.events.publish(BLOCK_CAPACITY, start_time, subscriber)
             return False
 
         for signal, bs in towers:
@@ -86,21 +144,75 @@ class Network:
                 session = bs.connect_call(subscriber, duration, start_time)
                 if session:
                     self.ocs.charge_subscriber(subscriber, estimated_cost)
-                    self.active_sessions.append(session)
+                    self.active_sessions[session] = None
+                    self.sessions_by_subscriber[subscriber] = session
                     self.total_successful_calls += 1
                     return True
-                else:
-                    self.blocked_by_capacity += 1
+                # Balance does not depend on the tower: one refusal per attempt
+                self.blocked_by_balance += 1
+                self.events.publish(BLOCK_BALANCE, start_time, subscriber, bs.id,
+                                    cost=estimated_cost, balance=subscriber.balance)
+                return False
+        self.blocked_by_capacity += 1
+        self.events.publish(BLOCK_CAPACITY, start_time, subscriber)
         return False
 
+    def request_call(self, subscriber, duration, start_time):
+        """First attempt of a call; if blocked, it joins the retrial queue per the retry policy."""
+        return request_call(self, subscriber, duration, start_time)
+
+    def retry_call(self, retry, now):
+        """Attempt a PendingRetry popped from the retrial queue; requeue it on failure."""
+        return retry_call(self, retry, now)
+
+    def connect_calls(self, batch):
+        """Admit a burst of (subscriber, duration, start_time) requests in one vectorized pass."""
+        return connect_calls(self, batch)
+
+    def get_cell_arrays(self):
+        """Cell positions/link parameters as arrays, rebuilt after the topology changes."""
+        if self.cell_arrays is None:
+            self.cell_arrays = CellArrays(self.base_stations)
+        return self.cell_arrays
+
     def check_connection_quality(self, subscriber, base_station):
-        """Delegate to physics module."""
+        """Delegate to physics module, or to the cached REM raster in "raster" mode."""
+        if self.physics == "raster":
+            return self.get_raster().check_connection_quality(subscriber, base_station)
         return check_connection_quality(subscriber, base_station)
 
+    def get_raster(self):
+        """Per-cell RSRP raster, built on first use and rebuilt after topology changes."""
+        if self.raster is None:
+            self.raster = RasterLinkBudget(self.base_stations, self.raster_resolution, cache=self.rem_cache)
+        return self.raster
+
+    def close(self):
+        """Flush and close CDR and event sinks."""
+        self.cdr_manager.close()
+        self.events.close()
+
+    def get_counters(self):
+        """Call outcome counters as a plain dict (picklable, for replication/sweep runners)."""
+        return {
+            "total_attempts": self.total_attempts,
+            "total_successful_calls": self.total_successful_calls,
+            "blocked_by_capacity": self.blocked_by_capacity,
+            "blocked_by_balance": self.blocked_by_balance,
+            "dropped_calls": self.dropped_calls,
+            "completed_calls": self.completed_calls,
+            "handovers": self.handovers,
+            **self.retrials.stats(),
+        }
+
     def get_report(self):
         """Delegate to reporting module."""
         get_report(self)
 
+    def get_cell_report(self, top=5):
+        """Delegate to reporting module."""
+        print_cell_report(self, top)
+
     def print_cdr_report(self):
         """Delegate to CDR manager."""
         self.cdr_manager.print_cdr_report()
@@ -110,8 +222,10 @@ class Network:
         self.cdr_manager.audit_network_revenue()
 
     def get_calls_by_phone(self, phone_number):
-        """Delegate to CDR manager."""
-        return self.cdr_manager.get_calls_by_phone(phone_number)
+        """Delegate to CDR manager; CDRs are keyed by id_number, so resolve the phone first."""
+        subscriber = self.subscribers.get(phone_number)
+        subscriber_id = subscriber.id_number if subscriber else phone_number
+        return self.cdr_manager.get_calls_by_phone(phone_number, subscriber_id)
 
     def print_subscriber_trace(self, subscriber_id):
         """Delegate to reporting module."""
@@ -0,0 +1,23 @@
+"""
+Behaviour switches for Network, grouped so the constructor only takes collaborators.
+"""
+from .rem.constants import DEFAULT_RASTER_RESOLUTION
+
+
+class NetworkOptions:
+    """
+    engine: "object" or "vectorized" tick engine; physics: "analytic" or "raster"
+    (per-cell REM layers at raster_resolution, optionally via the rem_cache CoverageCache);
+    handover: "full" or "incremental" (HandoverTracker with handover_options);
+    retry_policy: RetryPolicy for blocked calls (None = default policy).
+    """
+
+    def __init__(self, engine="object", physics="analytic", raster_resolution=DEFAULT_RASTER_RESOLUTION,
+                 rem_cache=None, handover="full", handover_options=None, retry_policy=None):
+        self.engine = engine
+        self.physics = physics
+        self.raster_resolution = raster_resolution
+        self.rem_cache = rem_cache
+        self.handover = handover
+        self.handover_options = handover_options or {}
+        self.retry_policy = retry_policy
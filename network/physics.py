@@ -2,6 +2,7 @@
 Network physics calculations (link budget, path loss).
 """
 import math
+import numpy as np
 
 
 def get_distance(user_equipment, base_station):
@@ -40,6 +41,32 @@ def check_connection_quality(subscriber_or_ue, base_station):
 def get_path_loss(distance):
     return 40 + 30 * math.log10(distance)
 
+def get_coverage_radius(tx_power, rx_sensitivity):
+    """Distance at which tx_power - get_path_loss(d) == rx_sensitivity; beyond it no link is possible."""
+    return max(1.0, 10 ** ((tx_power - 40 - rx_sensitivity) / 30))
+
+def get_rsrp_matrix(ue_positions, bs_positions, bs_tx_power):
+    """
+    Vectorized downlink RSRP for every UE x BS pair (same model as check_connection_quality).
+    ue_positions: (n_ue, 2), bs_positions: (n_bs, 2), bs_tx_power: (n_bs,).
+    Returns array of shape (n_ue, n_bs).
+    """
+    dx = ue_positions[:, 0, None] - bs_positions[None, :, 0]
+    dy = ue_positions[:, 1, None] - bs_positions[None, :, 1]
+    dist = np.maximum(np.sqrt(dx**2 + dy**2), 1)
+    return bs_tx_power[None, :] - (40 + 30 * np.log10(dist))
+
+def get_link_matrix(ue_positions, ue_tx_power, ue_rx_sensitivity, bs_positions, bs_tx_power, bs_rx_sensitivity):
+    """
+    Vectorized check_connection_quality for every UE x BS pair.
+    Returns (is_good_link, downlink_rsrp), both of shape (n_ue, n_bs).
+    """
+    downlink = get_rsrp_matrix(ue_positions, bs_positions, bs_tx_power)
+    path_loss = bs_tx_power[None, :] - downlink
+    uplink = ue_tx_power[:, None] - path_loss
+    good = (downlink > ue_rx_sensitivity[:, None]) & (uplink > bs_rx_sensitivity[None, :])
+    return good, downlink
+
 def get_signal_strength(tx_power, path_loss, antenna_type):
     rsrp = tx_power + get_antenna_gain(antenna_type) - path_loss
     print(f"RSRP: {rsrp}")
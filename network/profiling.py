@@ -0,0 +1,112 @@
+"""
+Per-phase wall-time instrumentation for Network.tick / Network.connect_call and a cProfile wrapper.
+"""
+import cProfile
+import csv
+import pstats
+from time import perf_counter
+
+# Phase ids index plain lists, so stop() is two list updates
+MOVE = 0
+MEASUREMENT = 1
+HANDOVER = 2
+LINK_CHECK = 3
+SESSION_CLOSE = 4
+MME_SELECT = 5
+PHASES = ("move", "measurement", "handover", "link_check", "session_close", "mme_select")
+
+
+class NullTimer:
+    """Disabled profiler: every hook is a no-op."""
+    enabled = False
+
+    def start(self):
+        return 0.0
+
+    def stop(self, phase, started):
+        pass
+
+    def end_tick(self):
+        pass
+
+
+class PhaseTimer:
+    """
+    Accumulates wall time and call counts per phase, plus a per-tick series
+    (seconds spent in each phase during each tick).
+
+    Usage at a hook: started = timer.start(); ...; timer.stop(MOVE, started)
+    """
+    enabled = True
+
+    def __init__(self, keep_series=True):
+        self.totals = [0.0] * len(PHASES)
+        self.calls = [0] * len(PHASES)
+        self.keep_series = keep_series
+        self.series = []
+        self.tick_totals = []
+        self._current = [0.0] * len(PHASES)
+        self._tick_started = perf_counter()
+
+    def start(self):
+        return perf_counter()
+
+    def stop(self, phase, started):
+        elapsed = perf_counter() - started
+        self.totals[phase] += elapsed
+        self.calls[phase] += 1
+        self._current[phase] += elapsed
+
+    def end_tick(self):
+        """Close the current tick's row of the series."""
+        now = perf_counter()
+        if self.keep_series:
+            self.series.append(self._current)
+            self.tick_totals.append(now - self._tick_started)
+        self._current = [0.0] * len(PHASES)
+        self._tick_started = now
+
+    def summary(self):
+        """One dict per phase: calls, total seconds, mean microseconds per call, share of instrumented time."""
+        instrumented = sum(self.totals) or 1.0
+        return [
+            {
+                "phase": name,
+                "calls": self.calls[i],
+                "total_s": self.totals[i],
+                "mean_us": self.totals[i] / self.calls[i] * 1e6 if self.calls[i] else 0.0,
+                "share": self.totals[i] / instrumented,
+            }
+            for i, name in enumerate(PHASES)
+        ]
+
+    def print_summary(self):
+        print(f"{'Фаза':>14} | {'Вызовы':>9} | {'Всего, с':>9} | {'мкс/вызов':>10} | {'Доля':>6}")
+        print("-" * 60)
+        for row in self.summary():
+            print(f"{row['phase']:>14} | {row['calls']:>9} | {row['total_s']:>9.3f} | "
+                  f"{row['mean_us']:>10.2f} | {row['share']:>6.1%}")
+        if self.tick_totals:
+            print(f"Тиков: {len(self.tick_totals)}, среднее время тика: "
+                  f"{sum(self.tick_totals) / len(self.tick_totals) * 1e3:.3f} мс")
+
+    def write_series(self, path):
+        """CSV with one row per tick: tick, total seconds, then seconds per phase."""
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(("tick", "total_s") + PHASES)
+            for tick, (total, row) in enumerate(zip(self.tick_totals, self.series), start=1):
+                writer.writerow([tick, total] + row)
+
+
+def profile_run(func, *args, output="profile.prof", top=20, **kwargs):
+    """Run func under cProfile, save stats to output and print the top entries by cumulative time."""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        profiler.disable()
+        profiler.dump_stats(output)
+        if top:
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(top)
@@ -0,0 +1,84 @@
+"""
+Content-addressed on-disk cache for REM arrays, stored as memory-mapped .npy files.
+"""
+import hashlib
+import os
+import numpy as np
+from .constants import DEFAULT_CACHE_DIR
+
+
+def station_key(base_station):
+    """Hash of everything that shapes a station's RSRP field."""
+    return _digest((
+        float(base_station.location_x), float(base_station.location_y), float(base_station.tx_power),
+        base_station.antenna_type, base_station.frequency,
+    ))
+
+
+def _digest(parts):
+    return hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()
+
+
+def _grid_signature(coverage_map):
+    return (coverage_map.resolution, coverage_map.shape, coverage_map.coverage_map.dtype.str)
+
+
+class CoverageCache:
+    """
+    Two key spaces under one directory:
+    map_*  - whole best-server map, keyed by the ordered topology and grid;
+    cell_* - one station's RSRP raster, keyed by the station and grid. CoverageMap
+             rebuilds a missed map from these, and raster physics mode reads them directly.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR):
+        self.directory = directory
+        self._station_keys = (None, [])
+        os.makedirs(directory, exist_ok=True)
+
+    def load_map(self, coverage_map):
+        """Memory-map a cached (read-only) best-server map into coverage_map. Returns True on hit."""
+        cached = self._load("map", self._map_key(coverage_map))
+        if cached is None:
+            return False
+        coverage_map.coverage_map = cached
+        return True
+
+    def save_map(self, coverage_map):
+        self._save("map", self._map_key(coverage_map), coverage_map.coverage_map)
+
+    def load_cell(self, coverage_map, base_station):
+        return self._load("cell", self._cell_key(coverage_map, base_station))
+
+    def save_cell(self, coverage_map, base_station, layer):
+        self._save("cell", self._cell_key(coverage_map, base_station), layer)
+
+    def _keys_of(self, coverage_map):
+        """Station keys in index order, memoized for the map being built."""
+        if self._station_keys[0] is not coverage_map:
+            self._station_keys = (coverage_map, [station_key(bs) for bs in coverage_map.base_stations.values()])
+        return self._station_keys[1]
+
+    def _map_key(self, coverage_map):
+        return _digest((_grid_signature(coverage_map), tuple(self._keys_of(coverage_map))))
+
+    def _cell_key(self, coverage_map, base_station):
+        return _digest((_grid_signature(coverage_map), station_key(base_station)))
+
+    def _path(self, kind, key):
+        return os.path.join(self.directory, f"{kind}_{key}.npy")
+
+    def _load(self, kind, key):
+        path = self._path(kind, key)
+        if not os.path.exists(path):
+            return None
+        # Plain ndarray view over the mapping: slicing np.memmap objects is slow in hot lookups
+        return np.asarray(np.load(path, mmap_mode="r"))
+
+    def _save(self, kind, key, array):
+        """Write via temp file + rename so concurrent runs never see partial files."""
+        path = self._path(kind, key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, np.asarray(array))
+        os.replace(tmp_path, path)
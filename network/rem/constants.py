@@ -0,0 +1,12 @@
+"""
+Radio Environment Map constants.
+"""
+NO_SIGNAL = -140.0
+NO_SERVER = -1
+DEFAULT_RESOLUTION = 1
+DEFAULT_TILE_SIZE = 256
+# Max float64 elements in one (tile pixels x stations) RSRP block (~32 MB)
+TILE_BUDGET = 4_000_000
+DEFAULT_RASTER_RESOLUTION = 5
+ERROR_SAMPLES = 10_000
+DEFAULT_CACHE_DIR = ".rem_cache"
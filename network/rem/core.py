@@ -1,38 +1,153 @@
 import numpy as np
-from network.physics import get_path_loss
-from base_station.core import BaseStation
-from equipment.core import UserEquipment
+from network.physics import get_rsrp_matrix
+from .constants import NO_SIGNAL, NO_SERVER, DEFAULT_RESOLUTION, DEFAULT_TILE_SIZE, TILE_BUDGET
 
 
 class CoverageMap:
-    def __init__(self, width, height, base_stations):
+    """
+    Best-server REM on a regular grid. Layers of coverage_map[x, y]:
+    0 - best-server RSRP, 1 - best-server index (bs_id_to_index), 2 - second-best RSRP.
+    Pixel (i, j) sits at (i * resolution, j * resolution) metres.
+    With a CoverageCache, an unchanged topology loads as a memory-mapped array; otherwise
+    the layers are reduced from the cached per-station rasters, so editing a station
+    recomputes only that station's raster.
+    """
+
+    def __init__(self, width, height, base_stations, resolution=DEFAULT_RESOLUTION,
+                 dtype=np.float64, tile_size=DEFAULT_TILE_SIZE, cache=None):
         self.width = width
         self.height = height
-        self.coverage_map = np.full((width, height, 3), -140.0)
-        self.coverage_map[:, :, 1] = -1
+        self.resolution = resolution
+        self.tile_size = tile_size
+        self.cache = cache
+        self.shape = (int(width // resolution), int(height // resolution))
+        self.coverage_map = np.full((*self.shape, 3), NO_SIGNAL, dtype=dtype)
+        self.coverage_map[:, :, 1] = NO_SERVER
         self.base_stations = base_stations
         self.bs_id_to_index = {bs_id: idx for idx, bs_id in enumerate(base_stations.keys())}
+        stations = list(base_stations.values())
+        self.bs_positions = np.array([(bs.location_x, bs.location_y) for bs in stations], dtype=float).reshape(-1, 2)
+        self.bs_tx_power = np.array([bs.tx_power for bs in stations], dtype=float)
+
+    @property
+    def best_rsrp(self):
+        return self.coverage_map[:, :, 0]
+
+    @property
+    def best_server(self):
+        return self.coverage_map[:, :, 1]
 
+    @property
+    def second_rsrp(self):
+        return self.coverage_map[:, :, 2]
 
     def update_coverage_map(self):
-        for bs_id, base_station in self.base_stations.items():
-            bs_index = self.bs_id_to_index[bs_id]
-            for x in range(self.width):
-                for y in range(self.height):
-                    distance = np.sqrt((x - base_station.location_x)**2 + (y - base_station.location_y)**2)
-                    if distance < 1:
-                        distance = 1
-                    path_loss = get_path_loss(distance)
-                    rsrp = base_station.tx_power - path_loss
-                    self.coverage_map[x, y, 0] = rsrp
-                    self.coverage_map[x, y, 1] = bs_index
+        """Fill all layers tile by tile; memory per step is bounded by TILE_BUDGET."""
+        if not self.base_stations:
+            return self.coverage_map
+        if self.cache and self.cache.load_map(self):
+            return self.coverage_map
+
+        cell_layers = self.build_cell_layers() if self.cache else None
+        nx, ny = self.shape
+        for x0 in range(0, nx, self.tile_size):
+            for y0 in range(0, ny, self.tile_size):
+                x1, y1 = min(x0 + self.tile_size, nx), min(y0 + self.tile_size, ny)
+                self.coverage_map[x0:x1, y0:y1] = self._tile_layers(x0, x1, y0, y1, cell_layers)
+
+        if self.cache:
+            self.cache.save_map(self)
+        return self.coverage_map
+
+    def build_cell_layers(self):
+        """Per-station RSRP rasters (list of 2D arrays) in bs_id_to_index order."""
+        return [self._cell_layer(bs) for bs in self.base_stations.values()]
+
+    def stations_reaching(self, x0, x1, y0, y1):
+        """
+        Indices of stations that can be best or second-best somewhere in the pixel box
+        [x0, x1) x [y0, y1). Two stations guarantee some RSRP floor over the whole box
+        (their RSRP at the farthest corner); a station whose RSRP at the nearest point of
+        the box is below the second of those floors is always beaten twice and is skipped.
+        """
+        low = np.array([x0, y0]) * self.resolution
+        high = (np.array([x1, y1]) - 1) * self.resolution
+        near = np.maximum(0, np.maximum(low - self.bs_positions, self.bs_positions - high))
+        far = np.maximum(self.bs_positions - low, high - self.bs_positions)
+        strongest = self._rsrp_at(np.hypot(near[:, 0], near[:, 1]))
+        weakest = self._rsrp_at(np.hypot(far[:, 0], far[:, 1]))
+        floor = NO_SIGNAL if len(weakest) < 2 else max(NO_SIGNAL, np.partition(weakest, -2)[-2])
+        return np.flatnonzero(strongest >= floor)
+
+    def _rsrp_at(self, distance):
+        """RSRP of every station at the given per-station distances (same model as get_rsrp_matrix)."""
+        return self.bs_tx_power - (40 + 30 * np.log10(np.maximum(distance, 1)))
+
+    def _tile_layers(self, x0, x1, y0, y1, cell_layers=None):
+        """(tile_x, tile_y, 3) layers of one tile, reduced from cell_layers when given."""
+        stations = self.stations_reaching(x0, x1, y0, y1)
+        points = self._tile_points(x0, x1, y0, y1) if cell_layers is None else None
+
+        def rsrp_of(indices):
+            if cell_layers is None:
+                return get_rsrp_matrix(points, self.bs_positions[indices], self.bs_tx_power[indices])
+            return np.stack([cell_layers[i][x0:x1, y0:y1].ravel() for i in indices], axis=1)
+
+        layers = self._tile_top2((x1 - x0) * (y1 - y0), stations, rsrp_of)
+        return layers.reshape(x1 - x0, y1 - y0, 3).astype(self.coverage_map.dtype)
+
+    def _cell_layer(self, base_station):
+        """RSRP raster of one station, via the cache when available."""
+        if self.cache:
+            cached = self.cache.load_cell(self, base_station)
+            if cached is not None:
+                return cached
+        points = self._tile_points(0, self.shape[0], 0, self.shape[1])
+        rsrp = get_rsrp_matrix(points, np.array([[base_station.location_x, base_station.location_y]], dtype=float),
+                               np.array([base_station.tx_power], dtype=float))
+        layer = rsrp.reshape(self.shape).astype(self.coverage_map.dtype)
+        if self.cache:
+            self.cache.save_cell(self, base_station, layer)
+        return layer
+
+    def _tile_points(self, x0, x1, y0, y1):
+        """(pixels, 2) metre coordinates of a tile, x-major like coverage_map."""
+        xs = np.arange(x0, x1) * self.resolution
+        ys = np.arange(y0, y1) * self.resolution
+        grid_x, grid_y = np.meshgrid(xs, ys, indexing='ij')
+        return np.column_stack((grid_x.ravel(), grid_y.ravel()))
+
+    def _tile_top2(self, count, stations, rsrp_of):
+        """Best RSRP, best index, second-best RSRP per point, over chunks of station indices;
+        rsrp_of(indices) returns the (count, len(indices)) RSRP block of those stations."""
+        best = np.full(count, NO_SIGNAL)
+        best_index = np.full(count, NO_SERVER)
+        second = np.full(count, NO_SIGNAL)
+        rows = np.arange(count)
+        chunk = max(1, TILE_BUDGET // count)
+
+        for start in range(0, len(stations), chunk):
+            indices = stations[start:start + chunk]
+            rsrp = rsrp_of(indices)
+            top_index = rsrp.argmax(axis=1)
+            top = rsrp[rows, top_index]
+            rsrp[rows, top_index] = -np.inf
+            runner_up = rsrp.max(axis=1) if rsrp.shape[1] > 1 else np.full(count, NO_SIGNAL)
+
+            better = top > best
+            second = np.where(better, np.maximum(best, runner_up), np.maximum(second, top))
+            best_index = np.where(better, indices[top_index], best_index)
+            best = np.where(better, top, best)
+        return np.column_stack((best, best_index, second))
+
 
 if __name__ == "__main__":
+    from base_station.core import BaseStation
+    from utils import load_config
+
     # Тестовый запуск
-    test_map = CoverageMap(1000, 1000, BaseStation.get_all_base_stations())
+    test_map = CoverageMap(1000, 1000, BaseStation.get_all_base_stations(load_config("config.yaml")))
     print("Тест пройден успешно!")
     print(test_map.coverage_map.shape)
+    test_map.update_coverage_map()
     print(test_map.coverage_map)
-    coverage_map_data = test_map.update_coverage_map()
-    print(test_map.coverage_map)
-
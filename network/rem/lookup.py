@@ -0,0 +1,92 @@
+"""
+Raster link budget: check_connection_quality answered by bilinear lookup into per-cell REM layers.
+"""
+import random
+import numpy as np
+from network.physics import check_connection_quality, get_rsrp_matrix
+from equipment.constants import CITY_SIZE
+from .core import CoverageMap
+from .constants import DEFAULT_RASTER_RESOLUTION, ERROR_SAMPLES
+
+
+class RasterLinkBudget:
+    """
+    Per-cell RSRP maps built once from CoverageMap (optionally via CoverageCache). Points outside the grid fall
+    back to the analytic model, so results there are exact.
+    error_bound holds max/p99/mean |raster - analytic| in dB over random samples.
+    """
+
+    def __init__(self, base_stations, resolution=DEFAULT_RASTER_RESOLUTION, size=CITY_SIZE,
+                 dtype=np.float32, cache=None):
+        # One extra pixel so the grid covers [0, size] inclusive for interpolation
+        coverage = CoverageMap(size + resolution, size + resolution, base_stations, resolution, dtype, cache=cache)
+        self.resolution = resolution
+        self.extent = (coverage.shape[0] - 1) * resolution
+        self.columns = coverage.bs_id_to_index
+        self.layers = coverage.build_cell_layers()
+        self.error_bound = self.estimate_error(base_stations)
+
+    def downlink_rsrp(self, x, y, base_station):
+        """Interpolated RSRP of base_station at (x, y), or None outside the grid."""
+        if not (0 <= x < self.extent and 0 <= y < self.extent):
+            return None
+        fx, fy = x / self.resolution, y / self.resolution
+        i, j = int(fx), int(fy)
+        tx, ty = fx - i, fy - j
+        (v00, v01), (v10, v11) = self.layers[self.columns[base_station.id]][i:i + 2, j:j + 2].tolist()
+        return (v00 * (1 - tx) + v10 * tx) * (1 - ty) + (v01 * (1 - tx) + v11 * tx) * ty
+
+    def rsrp_matrix(self, positions, bs_positions, bs_tx_power):
+        """
+        downlink_rsrp for (n, 2) positions x every cell (columns order), with the same
+        float64 arithmetic as the scalar path; rows outside the grid use get_rsrp_matrix.
+        """
+        x, y = positions[:, 0], positions[:, 1]
+        inside = (0 <= x) & (x < self.extent) & (0 <= y) & (y < self.extent)
+        rsrp = np.empty((len(positions), len(self.layers)))
+        if not inside.all():
+            rsrp[~inside] = get_rsrp_matrix(positions[~inside], bs_positions, bs_tx_power)
+        fx, fy = x[inside] / self.resolution, y[inside] / self.resolution
+        i, j = fx.astype(np.intp), fy.astype(np.intp)
+        tx, ty = fx - i, fy - j
+        for column, layer in enumerate(self.layers):
+            v00, v01 = layer[i, j].astype(float), layer[i, j + 1].astype(float)
+            v10, v11 = layer[i + 1, j].astype(float), layer[i + 1, j + 1].astype(float)
+            rsrp[inside, column] = (v00 * (1 - tx) + v10 * tx) * (1 - ty) + (v01 * (1 - tx) + v11 * tx) * ty
+        return rsrp
+
+    def check_connection_quality(self, subscriber_or_ue, base_station):
+        """Drop-in for physics.check_connection_quality. Returns (is_good_link, rsrp_dbm)."""
+        user_equipment = getattr(subscriber_or_ue, 'user_equipment', subscriber_or_ue)
+        dl_signal = self.downlink_rsrp(user_equipment.location_x, user_equipment.location_y, base_station)
+        if dl_signal is None:
+            return check_connection_quality(user_equipment, base_station)
+
+        # Uplink sees the same path loss: L = tx_bs - dl
+        ul_signal = user_equipment.tx_power - (base_station.tx_power - dl_signal)
+        is_good_link = dl_signal > user_equipment.rx_sensitivity and ul_signal > base_station.rx_sensitivity
+        return is_good_link, dl_signal
+
+    def estimate_error(self, base_stations, samples=ERROR_SAMPLES, seed=0):
+        """Sampled |raster - analytic| RSRP error in dB: {'max', 'p99', 'mean'}."""
+        if not base_stations:
+            return {'max': 0.0, 'p99': 0.0, 'mean': 0.0}
+        rng = random.Random(seed)
+        stations = list(base_stations.values())
+        probe = _Probe()
+        errors = []
+        for _ in range(samples):
+            probe.location_x, probe.location_y = rng.uniform(0, self.extent), rng.uniform(0, self.extent)
+            bs = rng.choice(stations)
+            exact = check_connection_quality(probe, bs)[1]
+            errors.append(abs(self.downlink_rsrp(probe.location_x, probe.location_y, bs) - exact))
+        errors = np.array(errors)
+        return {'max': float(errors.max()), 'p99': float(np.percentile(errors, 99)), 'mean': float(errors.mean())}
+
+
+class _Probe:
+    """Minimal UE stand-in for analytic reference queries."""
+    tx_power = 0
+    rx_sensitivity = 0
+    location_x = 0.0
+    location_y = 0.0
@@ -2,9 +2,9 @@
 Network reporting and visualization module.
 """
 import datetime
-import matplotlib.pyplot as plt
 import math
 import numpy as np
+from .rem.core import CoverageMap
 
 
 def get_report(network):
@@ -26,50 +26,63 @@ def get_report(network):
     print("="*30)
 
 
+def print_cell_report(network, top=5):
+    """Carried traffic per cell from the CellStateStore counters (no session walk)."""
+    cells = network.cell_state
+    erlangs = cells.carried_erlangs()
+    print("\n" + "="*30)
+    print("--- НАГРУЗКА СОТ ---")
+    print(f"Время наблюдения: {cells.elapsed():.0f} с, снимков: {cells.samples}")
+    print(f"Обслуженный трафик сети: {erlangs.sum():.3f} Эрл")
+    print(f"{'Сота':>10} | {'Эрл':>8} | {'Загрузка':>8} | {'Пик':>5}")
+    for bs, cell_erlangs, utilization, peak in cells.busiest(top):
+        print(f"{bs.id:>10} | {cell_erlangs:>8.3f} | {utilization:>8.1%} | {peak:>5}")
+    print("="*30)
+
+
 def print_subscriber_trace(network, subscriber_id):
     """Print subscriber movement and signal quality trace."""
     sub = network.subscribers.get(subscriber_id)
-    if not sub or not sub.user_equipment.history:
+    if not sub or not len(sub.user_equipment.trajectory):
         print(f"История для {subscriber_id} не найдена.")
         return
 
+    trajectory = sub.user_equipment.trajectory
+    samples = trajectory.view()
     print(f"\n--- ТРАССИРОВКА ПЕРЕМЕЩЕНИЙ И СИГНАЛА ДЛЯ {sub.first_name} ---")
     print(f"{'Время':<12} | {'X':<6} | {'Y':<6} | {'RSRP':<8} | {'Качество':<10} | {'БС'}")
     print("-" * 70)
 
-    for entry in sub.user_equipment.history:
-        readable_time = datetime.datetime.fromtimestamp(entry['time']).strftime('%H:%M:%S')
+    bs_ids = trajectory.base_station_ids(samples['cell'])
+    for (timestamp, x, y, rsrp, _), bs_id in zip(samples.tolist(), bs_ids):
+        readable_time = datetime.datetime.fromtimestamp(network.clock.to_wall(timestamp)).strftime('%H:%M:%S')
         
-        val = entry['rsrp']
-        if val > -80:
+        if rsrp > -80:
             q = "Excellent"
-        elif val > -90:
+        elif rsrp > -90:
             q = "Good"
-        elif val > -100:
+        elif rsrp > -100:
             q = "Fair"
         else:
             q = "Poor"
 
         print(f"{readable_time:<12} | "
-            f"{entry['x']:<6.1f} | "
-            f"{entry['y']:<6.1f} | "
-            f"{entry['rsrp']:<8.1f} | "
+            f"{x:<6.1f} | "
+            f"{y:<6.1f} | "
+            f"{rsrp:<8.1f} | "
             f"{q:<10} | "
-            f"{entry['base_station_id']}")
+            f"{bs_id}")
 
 
 def plot_subscriber_movement(network, subscriber_id):
     """Plot subscriber movement map with signal strength."""
+    import matplotlib.pyplot as plt  # plotting backend loads on first use, not on `import network`
     sub = network.subscribers.get(subscriber_id)
-    history = sub.user_equipment.history
-    
-    x_coords = [e['x'] for e in history]
-    y_coords = [e['y'] for e in history]
-    rsrp_vals = [e['rsrp'] for e in history]
+    samples = sub.user_equipment.trajectory.view()
 
     plt.figure(figsize=(10, 8))
     
-    path = plt.scatter(x_coords, y_coords, c=rsrp_vals, cmap='RdYlGn', label='Путь абонента')
+    path = plt.scatter(samples['x'], samples['y'], c=samples['rsrp'], cmap='RdYlGn', label='Путь абонента')
     plt.colorbar(path, label='RSRP (dBm)')
 
     for bs_id, bs in network.base_stations.items():
@@ -84,29 +97,21 @@ def plot_subscriber_movement(network, subscriber_id):
     plt.ylim(0, 1000)
     plt.show()
 
-def plot_coverage_gradient(network, resolution=15):
+def plot_coverage_gradient(network, resolution=15, cache=None):
     """
     Строит карту покрытия с плавным переходом:
     Зеленый (-50 дБм и выше) -> Желтый -> Красный (-110 дБм и ниже).
+    cache: CoverageCache — повторные запуски с той же топологией читают карту с диска.
     """
-    # 1. Подготовка сетки координат
-    x = np.linspace(0, 1000, 1000 // resolution)
-    y = np.linspace(0, 1000, 1000 // resolution)
+    import matplotlib.pyplot as plt
+    # 1-2. Максимальный RSRP в каждой точке сетки (best server из CoverageMap)
+    coverage = CoverageMap(1000 + resolution, 1000 + resolution, network.base_stations,
+                           resolution, dtype=np.float32, cache=cache)
+    coverage.update_coverage_map()
+    x = np.arange(coverage.shape[0]) * resolution
+    y = np.arange(coverage.shape[1]) * resolution
     X, Y = np.meshgrid(x, y)
-    Z = np.full(X.shape, -140.0) # Фоновое значение (очень слабый сигнал)
-
-    # 2. Расчет максимального RSRP для каждой точки сетки
-    for bs in network.base_stations.values():
-        # Дистанция от каждой точки сетки до текущей БС
-        dist_sq = (X - bs.location_x)**2 + (Y - bs.location_y)**2
-        dist = np.sqrt(np.maximum(dist_sq, 1.0))
-        
-        # Формула Path Loss: L = 40 + 30 * log10(d) [из physics.py]
-        path_loss = 40 + 30 * np.log10(dist)
-        rsrp = bs.tx_power - path_loss
-        
-        # Выбираем лучший сигнал из всех доступных вышек
-        Z = np.maximum(Z, rsrp)
+    Z = coverage.best_rsrp.T
 
     # 3. Визуализация
     plt.figure(figsize=(11, 8))
@@ -0,0 +1,162 @@
+"""
+Central retrial queue: blocked calls wait in a heap keyed by retry time.
+"""
+import heapq
+import itertools
+import math
+import random
+import numpy as np
+from events.constants import RETRY
+from .constants import DEFAULT_RETRIAL_DELAY
+
+
+class RetryPolicy:
+    """
+    How blocked callers retry. Delay before retry n (1-based) is
+    randint(*delay) * backoff ** (n - 1); after max_attempts retries (None = unlimited)
+    the call is given up, and after every failure the caller abandons with
+    abandon_probability. The defaults reproduce the classic "retry in 5-15 s forever".
+    next_delay draws from the global `random` stream (per-subscriber simulation);
+    sample draws a batch from a numpy Generator (seeded population-level traffic).
+    """
+
+    def __init__(self, delay=DEFAULT_RETRIAL_DELAY, max_attempts=None, backoff=1.0, abandon_probability=0.0):
+        self.delay = tuple(delay)
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.abandon_probability = abandon_probability
+
+    def next_delay(self, attempt):
+        """Seconds until retry number `attempt`, or None if the caller gives up."""
+        if self.max_attempts is not None and attempt > self.max_attempts:
+            return None
+        # Draw only when abandonment is enabled, so the default policy keeps the random stream unchanged
+        if self.abandon_probability and random.random() < self.abandon_probability:
+            return None
+        delay = random.randint(*self.delay)
+        return delay * self.backoff ** (attempt - 1) if self.backoff != 1 else delay
+
+    def sample(self, attempts, rng):
+        """Vectorized next_delay for an array of retry numbers; NaN where the caller gives up."""
+        attempts = np.asarray(attempts)
+        low, high = self.delay
+        delays = rng.integers(low, high + 1, size=len(attempts)).astype(float)
+        if self.backoff != 1:
+            delays *= self.backoff ** (attempts - 1)
+        give_up = np.zeros(len(attempts), dtype=bool)
+        if self.max_attempts is not None:
+            give_up |= attempts > self.max_attempts
+        if self.abandon_probability:
+            give_up |= rng.random(len(attempts)) < self.abandon_probability
+        delays[give_up] = np.nan
+        return delays
+
+
+class PendingRetry:
+    __slots__ = ('subscriber', 'duration', 'attempt', 'due')
+
+    def __init__(self, subscriber, duration, attempt, due):
+        self.subscriber = subscriber
+        self.duration = duration
+        self.attempt = attempt
+        self.due = due
+
+
+class RetrialQueue:
+    """
+    Min-heap of PendingRetry by due time; at most one pending retry per subscriber.
+    Entries superseded by a newer retry of the same subscriber are skipped lazily.
+    """
+
+    def __init__(self, policy=None):
+        self.policy = policy or RetryPolicy()
+        self.heap = []
+        self.pending = {}
+        self.sequence = itertools.count()
+        self.scheduled = 0
+        self.attempts = 0
+        self.successes = 0
+        self.abandoned = 0
+        self.exhausted = 0
+        self.peak_pending = 0
+
+    def schedule(self, subscriber, duration, now, attempt=1):
+        """Queue retry number `attempt` after a failed call. Returns the PendingRetry or None if given up."""
+        return self._push(subscriber, duration, now, attempt, self.policy.next_delay(attempt))
+
+    def schedule_many(self, failed, now, rng):
+        """
+        schedule for a batch of (subscriber, duration, attempt) with delays drawn from the
+        numpy Generator rng in one call (RetryPolicy.sample). Returns [PendingRetry or None].
+        """
+        if not failed:
+            return []
+        delays = self.policy.sample([attempt for _, _, attempt in failed], rng).tolist()
+        return [self._push(subscriber, duration, now, attempt, None if math.isnan(delay) else delay)
+                for (subscriber, duration, attempt), delay in zip(failed, delays)]
+
+    def _push(self, subscriber, duration, now, attempt, delay):
+        if delay is None:
+            if self.policy.max_attempts is not None and attempt > self.policy.max_attempts:
+                self.exhausted += 1
+            else:
+                self.abandoned += 1
+            return None
+        entry = PendingRetry(subscriber, duration, attempt, now + delay)
+        self.pending[subscriber] = entry
+        heapq.heappush(self.heap, (entry.due, next(self.sequence), entry))
+        self.scheduled += 1
+        self.peak_pending = max(self.peak_pending, len(self.pending))
+        return entry
+
+    def is_waiting(self, subscriber):
+        return subscriber in self.pending
+
+    def pop_due(self, now):
+        """Remove and return {subscriber: PendingRetry} for every retry due at or before now."""
+        due = {}
+        heap = self.heap
+        while heap and heap[0][0] <= now:
+            entry = heapq.heappop(heap)[2]
+            if self.pending.get(entry.subscriber) is entry:
+                del self.pending[entry.subscriber]
+                due[entry.subscriber] = entry
+        return due
+
+    def record(self, success):
+        """Count the outcome of one retry attempt."""
+        self.attempts += 1
+        if success:
+            self.successes += 1
+
+    def stats(self):
+        return {
+            "retry_scheduled": self.scheduled,
+            "retry_attempts": self.attempts,
+            "retry_successes": self.successes,
+            "retry_abandoned": self.abandoned,
+            "retry_exhausted": self.exhausted,
+            "retry_pending": len(self.pending),
+            "retry_peak_pending": self.peak_pending,
+        }
+
+    def __len__(self):
+        return len(self.pending)
+
+
+def request_call(network, subscriber, duration, start_time):
+    """First attempt of a call; if blocked, it joins network.retrials per the retry policy."""
+    if network.connect_call(subscriber, duration, start_time):
+        return True
+    network.retrials.schedule(subscriber, duration, start_time)
+    return False
+
+
+def retry_call(network, retry, now):
+    """Attempt a PendingRetry popped from network.retrials; requeue it on failure."""
+    network.events.publish(RETRY, now, retry.subscriber)
+    success = network.connect_call(retry.subscriber, retry.duration, now)
+    network.retrials.record(success)
+    if not success:
+        network.retrials.schedule(retry.subscriber, retry.duration, now, retry.attempt + 1)
+    return success
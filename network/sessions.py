@@ -0,0 +1,84 @@
+"""
+Per-tick session lifecycle: measurement, handover, then drop or completion of a live session.
+"""
+from events.constants import HANDOVER, DROP, COMPLETE
+from .profiling import MEASUREMENT, HANDOVER as HANDOVER_PHASE, LINK_CHECK, SESSION_CLOSE
+
+
+def update_session(network, session):
+    """Measurement report, handover decision and drop/complete check. Returns True if still active."""
+    ue = session.subscriber.user_equipment
+    source_bs = session.base_station
+    timer = network.profiler
+
+    if network.handover:
+        started = timer.start()
+        current_rsrp, target_bs = network.handover.evaluate(session)
+        timer.stop(MEASUREMENT, started)
+        started = timer.start()
+    else:
+        started = timer.start()
+        mr = ue.generate_measurement_report(network, session.subscriber)
+        timer.stop(MEASUREMENT, started)
+        started = timer.start()
+        _, current_rsrp = network.check_connection_quality(session.subscriber, source_bs)
+        timer.stop(LINK_CHECK, started)
+        started = timer.start()
+        target_bs = source_bs.evaluate_handover(current_rsrp, mr)
+
+    handed_over = try_handover(network, session, target_bs)
+    timer.stop(HANDOVER_PHASE, started)
+    if handed_over:
+        started = timer.start()
+        _, current_rsrp = network.check_connection_quality(session.subscriber, target_bs)
+        timer.stop(LINK_CHECK, started)
+
+    return settle_session(network, session, current_rsrp)
+
+
+def try_handover(network, session, target_bs):
+    """Move session to target_bs if it has free capacity. Returns True on handover."""
+    if not target_bs or target_bs.current_calls >= target_bs.capacity:
+        return False
+    source_bs = session.base_station
+    network.events.publish(HANDOVER, network.clock.now, session.subscriber, target_bs.id,
+                           source=source_bs.id, target=target_bs.id)
+    source_bs.current_calls -= 1
+    session.base_station = target_bs
+    target_bs.current_calls += 1
+    network.handovers += 1
+    return True
+
+
+def settle_session(network, session, current_rsrp):
+    """Log UE state, then drop or complete the session. Returns True if it stays active."""
+    ue = session.subscriber.user_equipment
+    now = network.clock.now
+    ue.log_state(now, current_rsrp, session.base_station.id)
+
+    if current_rsrp <= ue.rx_sensitivity:
+        network.events.publish(DROP, now, session.subscriber, session.base_station.id,
+                               x=ue.location_x, y=ue.location_y)
+        close_session(network, session, "DROPPED")
+        return False
+    if session.end_time <= now:
+        close_session(network, session, "COMPLETED")
+        return False
+    return True
+
+
+def close_session(network, session, reason):
+    """Write CDR via CDRManager and drop the session from the live set and subscriber index."""
+    started = network.profiler.start()
+    network.cdr_manager.close_session(session, reason)
+    network.sessions_by_subscriber.pop(session.subscriber, None)
+    network.active_sessions.pop(session, None)
+    if network.handover:
+        network.handover.forget(session)
+    if reason == "DROPPED":
+        network.dropped_calls += 1
+    else:
+        network.completed_calls += 1
+        network.events.publish(COMPLETE, network.clock.now, session.subscriber, session.base_station.id,
+                               duration=session.duration)
+    network.profiler.stop(SESSION_CLOSE, started)
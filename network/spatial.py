@@ -0,0 +1,53 @@
+"""
+Uniform grid index over base station coordinates for radius-limited cell search.
+"""
+import math
+from .constants import SEARCH_MARGIN
+
+
+class GridIndex:
+    """
+    Buckets base stations into square cells of cell_size metres.
+    query() returns stations in insertion order so sort-based tie-breaking
+    matches a plain scan over network.base_stations.
+    """
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.stations = []
+        self.slots = {}
+        self.max_tx_power = -math.inf
+
+    def add(self, base_station):
+        """Insert or replace (same id) a base station."""
+        slot = self.slots.get(base_station.id)
+        if slot is None:
+            slot = len(self.stations)
+            self.slots[base_station.id] = slot
+            self.stations.append(base_station)
+        else:
+            old = self.stations[slot]
+            self.cells[self._cell_of(old.location_x, old.location_y)].remove(slot)
+            self.stations[slot] = base_station
+        self.cells.setdefault(self._cell_of(base_station.location_x, base_station.location_y), []).append(slot)
+        self.max_tx_power = max(self.max_tx_power, base_station.tx_power)
+
+    def query(self, x, y, radius):
+        """Stations within radius (+ margin for float rounding) of (x, y)."""
+        reach = radius + SEARCH_MARGIN
+        min_cx, min_cy = self._cell_of(x - reach, y - reach)
+        max_cx, max_cy = self._cell_of(x + reach, y + reach)
+        slots = []
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                slots.extend(self.cells.get((cx, cy), ()))
+        slots.sort()
+        return [bs for bs in map(self.stations.__getitem__, slots) if self._within(bs, x, y, reach)]
+
+    def _cell_of(self, x, y):
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    @staticmethod
+    def _within(base_station, x, y, reach):
+        return (base_station.location_x - x)**2 + (base_station.location_y - y)**2 <= reach * reach
@@ -1,8 +1,11 @@
-import matplotlib.pyplot as plt
 import math
+from .physics import get_coverage_radius
 
 class LiveVisualizer:
     def __init__(self, network):
+        import matplotlib.pyplot as plt  # plotting backend loads on first use
+
+        self.plt = plt
         self.network = network
         plt.ion() # Включаем интерактивный режим
         self.fig, self.ax = plt.subplots(figsize=(10, 8))
@@ -10,37 +13,31 @@ class LiveVisualizer:
     def calculate_coverage_radius(self, bs):
         """Вычисляет радиус покрытия на основе Link Budget."""
         # Предел: rsrp == rx_sensitivity
-        # tx_power - (40 + 30 * log10(dist)) = rx_sensitivity
-        exponent = (bs.tx_power - 40 - bs.rx_sensitivity) / 30
-        return 10 ** exponent
+        return get_coverage_radius(bs.tx_power, bs.rx_sensitivity)
 
     def update(self, subscriber_id):
         sub = self.network.subscribers.get(subscriber_id)
-        if not sub or not sub.user_equipment.history:
+        if not sub or not len(sub.user_equipment.trajectory):
             return
 
         self.ax.clear()
         ue = sub.user_equipment
-        history = ue.history
+        samples = ue.trajectory.view()
         
         # 1. Отрисовка вышек и зон покрытия
         for bs in self.network.base_stations.values():
             radius = self.calculate_coverage_radius(bs)
-            circle = plt.Circle((bs.location_x, bs.location_y), radius, 
+            circle = self.plt.Circle((bs.location_x, bs.location_y), radius, 
                                 color='red', fill=True, alpha=0.05)
             self.ax.add_patch(circle)
             self.ax.plot(bs.location_x, bs.location_y, 'r^', markersize=12)
             self.ax.text(bs.location_x + 5, bs.location_y + 5, bs.id, color='red')
 
         # 2. Отрисовка пути (цвет зависит от RSRP)
-        x_vals = [e['x'] for e in history]
-        y_vals = [e['y'] for e in history]
-        rsrp_vals = [e['rsrp'] for e in history]
-        
-        path = self.ax.scatter(x_vals, y_vals, c=rsrp_vals, cmap='RdYlGn', s=10, vmin=-110, vmax=-60)
+        path = self.ax.scatter(samples['x'], samples['y'], c=samples['rsrp'], cmap='RdYlGn', s=10, vmin=-110, vmax=-60)
         
         # 3. Текущая позиция и линия связи
-        current_bs_id = history[-1]['base_station_id']
+        current_bs_id = ue.trajectory.cell_ids.lookup(samples['cell'][-1])
         current_bs = self.network.base_stations.get(current_bs_id)
         
         if current_bs:
@@ -52,12 +49,12 @@ class LiveVisualizer:
         # Настройка осей
         self.ax.set_xlim(0, 1000)
         self.ax.set_ylim(0, 1000)
-        self.ax.set_title(f"Симуляция: {sub.first_name} | BS: {current_bs_id} | RSRP: {history[-1]['rsrp']:.1f} dBm")
+        self.ax.set_title(f"Симуляция: {sub.first_name} | BS: {current_bs_id} | RSRP: {samples['rsrp'][-1]:.1f} dBm")
         self.ax.grid(True, alpha=0.3)
         
-        plt.draw()
-        plt.pause(0.001) # Короткая пауза для обновления кадра
+        self.plt.draw()
+        self.plt.pause(0.001) # Короткая пауза для обновления кадра
 
     def finalize(self):
-        plt.ioff()
-        plt.show()
\ No newline at end of file
+        self.plt.ioff()
+        self.plt.show()
\ No newline at end of file
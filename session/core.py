@@ -4,10 +4,12 @@ Call session management module.
 
 
 class CallSession:
+    __slots__ = ('subscriber', 'base_station', 'duration', 'start_time', 'end_time')
+
     def __init__(self, subscriber, base_station, duration, start_time):
         self.subscriber = subscriber
         self.base_station = base_station
-        self.remaining_time = duration
         self.duration = duration
         self.start_time = start_time
+        self.end_time = start_time + duration
 
@@ -0,0 +1,12 @@
+"""
+Simulation module public API.
+"""
+from .builder import build_network
+from .core import run_simulation, run_ticks
+from .scheduler import EventDrivenSimulation
+from .traffic import TrafficGenerator
+from .replication import run_replications, summarize
+from .sweep import run_sweep, grid_points, latin_hypercube, tidy_table, SweepCache
+
+__all__ = ['build_network', 'run_simulation', 'run_ticks', 'EventDrivenSimulation', 'TrafficGenerator', 'run_replications', 'summarize',
+           'run_sweep', 'grid_points', 'latin_hypercube', 'tidy_table', 'SweepCache']
@@ -0,0 +1,134 @@
+"""
+Build a Network from a parsed config.yaml.
+"""
+import math
+import os
+import random
+from tariff import Tariff
+from network import Network, NetworkOptions
+from base_station.core import BaseStation
+from base_station.constants import DEFAULT_CAPACITY, SAMPLE_EVERY
+from base_station.state import CellStateStore
+from subscriber import Subscriber
+from equipment import UserEquipment
+from equipment.trajectory import TrajectoryStore
+from equipment.constants import TRAJECTORY_MAX_SAMPLES, TRAJECTORY_EVERY, CITY_SIZE
+from network.rem.constants import DEFAULT_RASTER_RESOLUTION
+from network.rem.cache import CoverageCache
+from network.cdr import FileCDRSink
+from network.cdr.constants import DEFAULT_BATCH_SIZE
+from network.profiling import PhaseTimer
+from network.retrial import RetryPolicy
+from network.constants import DEFAULT_RETRIAL_DELAY
+from events import EventBus, NullSink, CounterSink, JsonlSink, ConsoleSink
+from events.constants import SINK_NULL, SINK_COUNTER, SINK_JSONL, SINK_CONSOLE, DEFAULT_EVENT_LOG, DEFAULT_BUFFER_SIZE
+from utils import intern_id
+
+ARRIVAL_RATE = 0.002
+AVG_DURATION = 5
+# simulation.* keys passed through to network.handover.HandoverTracker
+HANDOVER_OPTIONS = ('offset', 'time_to_trigger', 'rerank_distance', 'rerank_margin')
+
+
+def build_cdr_sink(sim_config):
+    """FileCDRSink when simulation.cdr_file is set, otherwise None (in-memory CDRs)."""
+    if not sim_config.get('cdr_file'):
+        return None
+    return FileCDRSink(sim_config['cdr_file'], sim_config.get('cdr_batch_size', DEFAULT_BATCH_SIZE),
+                       sim_config.get('cdr_format'))
+
+
+def build_event_bus(sim_config):
+    """EventBus with the sinks listed in simulation.events; no sinks (silent) when the key is absent."""
+    sinks = []
+    for name in sim_config.get('events') or ():
+        if name == SINK_CONSOLE:
+            sinks.append(ConsoleSink())
+        elif name == SINK_COUNTER:
+            sinks.append(CounterSink())
+        elif name == SINK_JSONL:
+            sinks.append(JsonlSink(sim_config.get('event_log', DEFAULT_EVENT_LOG),
+                                   sim_config.get('event_buffer_size', DEFAULT_BUFFER_SIZE)))
+        elif name == SINK_NULL:
+            sinks.append(NullSink())
+        else:
+            raise ValueError(f"Unknown event sink: {name}")
+    return EventBus(sinks)
+
+
+def build_cell_state(sim_config):
+    """Cell counters with the occupancy matrix preallocated for the whole run."""
+    every = sim_config.get('occupancy_every', SAMPLE_EVERY)
+    return CellStateStore(every, max(1, math.ceil(sim_config.get('duration_seconds', 0) / every)))
+
+
+def build_retry_policy(sim_config):
+    """RetryPolicy from simulation.retry_* keys (defaults: 5-15 s, unlimited, no backoff)."""
+    return RetryPolicy(
+        sim_config.get('retry_delay', DEFAULT_RETRIAL_DELAY),
+        sim_config.get('retry_max_attempts'),
+        sim_config.get('retry_backoff', 1.0),
+        sim_config.get('retry_abandon_probability', 0.0),
+    )
+
+
+def build_network_options(sim_config):
+    """NetworkOptions from simulation.engine/physics/raster_*/rem_cache_dir/handover*/retry_* keys."""
+    return NetworkOptions(
+        engine=sim_config.get('engine', 'object'),
+        physics=sim_config.get('physics', 'analytic'),
+        raster_resolution=sim_config.get('raster_resolution', DEFAULT_RASTER_RESOLUTION),
+        rem_cache=CoverageCache(sim_config['rem_cache_dir']) if sim_config.get('rem_cache_dir') else None,
+        handover=sim_config.get('handover', 'full'),
+        handover_options={key: sim_config[key] for key in HANDOVER_OPTIONS if key in sim_config},
+        retry_policy=build_retry_policy(sim_config),
+    )
+
+
+def build_trajectory(sim_config, ue_id):
+    """UE history store with the retention policy from simulation.trajectory_* keys."""
+    spill_dir = sim_config.get('trajectory_spill_dir')
+    if spill_dir:
+        os.makedirs(spill_dir, exist_ok=True)
+    return TrajectoryStore(
+        sim_config.get('trajectory_max_samples', TRAJECTORY_MAX_SAMPLES),
+        sim_config.get('trajectory_every', TRAJECTORY_EVERY),
+        os.path.join(spill_dir, f"{ue_id}.traj") if spill_dir else None,
+    )
+
+
+def build_network(config):
+    """Create Network, tariffs, base stations and funded subscribers described by config."""
+    sim_config = config['simulation']
+    network = Network(
+        build_network_options(sim_config),
+        cdr_sink=build_cdr_sink(sim_config),
+        events=build_event_bus(sim_config),
+        profiler=PhaseTimer() if sim_config.get('profile') else None,
+        cell_state=build_cell_state(sim_config),
+    )
+
+    # Словарь тарифов для быстрого поиска
+    arrival_rate = sim_config.get('arrival_rate', ARRIVAL_RATE)
+    avg_duration = sim_config.get('avg_duration', AVG_DURATION)
+    # One Tariff object per plan, shared by reference by every subscriber on it
+    tariffs = {t['name']: Tariff(intern_id(t['name']), t['price_per_minute']) for t in config['tariffs']}
+
+    for bs_data in config['base_stations']:
+        bs = BaseStation(intern_id(bs_data['id']), bs_data.get('capacity', DEFAULT_CAPACITY), bs_data['x'], bs_data['y'],
+                         bs_data['frequency'], bs_data['bandwidth'], bs_data['antenna_type'])
+        network.add_base_station(bs)
+
+    for sub_data in config['subscribers']:
+        ue = UserEquipment(intern_id(sub_data['id']), random.randint(0, CITY_SIZE), random.randint(0, CITY_SIZE))
+        ue.trajectory = build_trajectory(sim_config, sub_data['id'])
+        # Names repeat across a large population; id_number and phone share one object
+        phone = intern_id(sub_data['phone'])
+        sub = Subscriber(
+            intern_id(sub_data['name']), intern_id(sub_data['surname']), phone,
+            ue, intern_id(sub_data['email']), phone,
+            tariffs['Basic'], arrival_rate, avg_duration
+        )
+        sub.top_up(sub_data['initial_balance'])
+        network.add_subscriber(sub)
+    return network
@@ -0,0 +1,36 @@
+"""
+Simulation constants.
+"""
+MODE_TICK = "tick"
+MODE_EVENT = "event"
+DEFAULT_MEASUREMENT_INTERVAL = 1
+PROGRESS_EVERY = 100
+
+# Event kinds; the value is the tie-break priority for events at the same time
+SESSION_END = 0
+RETRY = 1
+ARRIVAL = 2
+MEASUREMENT = 3
+
+# Monte Carlo replications
+CONFIDENCE_LEVEL = 0.95
+# Two-sided Student t critical values at 95% for df = 1..30; normal 1.96 beyond
+T_CRITICAL_95 = (
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+)
+Z_CRITICAL_95 = 1.96
+# Per-run file outputs that would collide between parallel workers
+REPLICATION_DROPPED_KEYS = ('cdr_file', 'trajectory_spill_dir', 'event_log', 'profile', 'profile_series',
+                            'cprofile_output')
+
+# Parameter sweeps
+SWEEP_PARAMETERS = ('capacity', 'arrival_rate', 'avg_duration', 'layout')
+DEFAULT_SWEEP_CACHE_DIR = ".sweep_cache"
+
+# Call generation: "object" (Subscriber.act per subscriber) | "vectorized" (TrafficGenerator)
+TRAFFIC_OBJECT = "object"
+TRAFFIC_VECTORIZED = "vectorized"
+# Ticks of arrival uniforms drawn per TrafficGenerator refill
+TRAFFIC_BLOCK = 64
@@ -0,0 +1,64 @@
+"""
+Simulation runners: fixed 1-second polling or discrete-event scheduling.
+"""
+from network.profiling import profile_run
+from .constants import MODE_EVENT, DEFAULT_MEASUREMENT_INTERVAL, PROGRESS_EVERY, TRAFFIC_VECTORIZED
+from .scheduler import EventDrivenSimulation
+from .traffic import TrafficGenerator
+
+
+def run_ticks(network, duration, progress=True, traffic=None):
+    """
+    Classic loop: every subscriber acts every second, then the network ticks.
+    With a TrafficGenerator the whole population's attempts are drawn in one call instead.
+    """
+    for second in range(1, duration):
+        now = network.clock.now
+        if traffic:
+            traffic.step(now)
+        else:
+            _act_all(network, now)
+        network.tick()
+        if progress and second % PROGRESS_EVERY == 0:
+            print(f"Прошло {second} секунд...")
+
+
+def _act_all(network, now):
+    """One second of subscriber activity; due retrials run in subscriber order, where the caller would act."""
+    due = network.retrials.pop_due(now)
+    for sub in network.subscribers.values():
+        retry = due.get(sub) if due else None
+        if retry is not None:
+            network.retry_call(retry, now)
+        else:
+            sub.act(network)
+
+
+def run_simulation(network, sim_config, progress=True):
+    """
+    Run network for sim_config['duration_seconds'] in the configured mode, optionally under
+    cProfile (simulation.cprofile_output). With simulation.profile set, prints the per-phase
+    summary and saves the per-tick series to simulation.profile_series.
+    """
+    if sim_config.get('cprofile_output'):
+        profile_run(_run, network, sim_config, progress, output=sim_config['cprofile_output'])
+    else:
+        _run(network, sim_config, progress)
+
+    if network.profiler.enabled:
+        network.profiler.print_summary()
+        if sim_config.get('profile_series'):
+            network.profiler.write_series(sim_config['profile_series'])
+
+
+def _run(network, sim_config, progress):
+    duration = sim_config['duration_seconds']
+    if sim_config.get('mode') == MODE_EVENT:
+        interval = sim_config.get('measurement_interval', DEFAULT_MEASUREMENT_INTERVAL)
+        # run_ticks covers seconds 1..duration-1
+        EventDrivenSimulation(network, interval).run(duration - 1)
+        return
+    traffic = None
+    if sim_config.get('traffic') == TRAFFIC_VECTORIZED:
+        traffic = TrafficGenerator(network, sim_config.get('traffic_seed'))
+    run_ticks(network, duration, progress, traffic)
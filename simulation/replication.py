@@ -0,0 +1,112 @@
+"""
+Parallel Monte Carlo replications: independent seeded runs merged into summary statistics.
+"""
+import contextlib
+import copy
+import math
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .builder import build_network
+from .core import run_simulation
+from .constants import T_CRITICAL_95, Z_CRITICAL_95, CONFIDENCE_LEVEL, REPLICATION_DROPPED_KEYS
+
+
+def replication_config(config):
+    """Copy of config safe to run in many processes at once (no shared output files)."""
+    config = copy.deepcopy(config)
+    for key in REPLICATION_DROPPED_KEYS:
+        config['simulation'].pop(key, None)
+    config['simulation']['events'] = []
+    return config
+
+
+def seed_streams(seed, replications):
+    """Independent child SeedSequences, one per replication."""
+    return np.random.SeedSequence(seed).spawn(replications)
+
+
+def run_replication(config, seed_sequence, index=0):
+    """One silent, seeded run in this process; returns the network counters."""
+    random.seed(int(seed_sequence.generate_state(1)[0]))
+    np.random.seed(seed_sequence.generate_state(1, np.uint32)[0])
+    config = dict(config, simulation=dict(config['simulation'], traffic_seed=seed_sequence.spawn(1)[0]))
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        network = build_network(config)
+        run_simulation(network, config['simulation'], progress=False)
+        network.close()
+    result = network.get_counters()
+    result['replication'] = index
+    result['seed_entropy'] = seed_sequence.entropy
+    result['seed_spawn_key'] = list(seed_sequence.spawn_key)
+    return result
+
+
+def summarize(results):
+    """Mean, sample std and 95% confidence interval of every numeric counter across runs."""
+    n = len(results)
+    t = T_CRITICAL_95[n - 2] if 2 <= n <= len(T_CRITICAL_95) + 1 else Z_CRITICAL_95
+    summary = {}
+    metrics = [key for key in results[0] if key not in ('replication', 'seed_entropy', 'seed_spawn_key')]
+    rows = [dict(r, **rates(r)) for r in results]
+    for key in metrics + list(rates(results[0])):
+        values = np.array([r[key] for r in rows], dtype=float)
+        mean = float(values.mean())
+        std = float(values.std(ddof=1)) if n > 1 else 0.0
+        half_width = t * std / math.sqrt(n) if n > 1 else 0.0
+        summary[key] = {
+            "mean": mean,
+            "std": std,
+            "ci_low": mean - half_width,
+            "ci_high": mean + half_width,
+        }
+    return summary
+
+
+def rates(counters):
+    """Blocking and drop probabilities derived from one run's counters."""
+    attempts = counters['total_attempts']
+    connected = counters['total_successful_calls']
+    return {
+        "blocking_rate": (counters['blocked_by_capacity'] + counters['blocked_by_balance']) / attempts if attempts else 0.0,
+        "capacity_blocking_rate": counters['blocked_by_capacity'] / attempts if attempts else 0.0,
+        "drop_rate": counters['dropped_calls'] / connected if connected else 0.0,
+    }
+
+
+def run_replications(config, replications, seed=0, workers=None):
+    """
+    Run `replications` independent simulations of config across a process pool.
+
+    Every worker gets its own SeedSequence child, so results are reproducible for a given
+    seed regardless of worker count or completion order. Returns
+    {"replications": [counters...], "summary": {metric: {mean, std, ci_low, ci_high}}, ...}.
+    """
+    config = replication_config(config)
+    streams = seed_streams(seed, replications)
+    if workers == 1:
+        results = [run_replication(config, s, i) for i, s in enumerate(streams)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(run_replication, [config] * replications, streams, range(replications)))
+    return {
+        "replications": results,
+        "summary": summarize(results),
+        "count": replications,
+        "seed": seed,
+        "confidence": CONFIDENCE_LEVEL,
+    }
+
+
+if __name__ == "__main__":
+    import json
+    from utils import load_config
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    output = run_replications(load_config("config.yaml"), count)
+    json.dump(output["summary"], sys.stdout, indent=2, ensure_ascii=False)
+    print()
@@ -0,0 +1,123 @@
+"""
+Discrete-event simulation: a heap of arrival, retrial, session-end and measurement events.
+"""
+import heapq
+import itertools
+import math
+import random
+from .constants import ARRIVAL, RETRY, SESSION_END, MEASUREMENT
+
+
+class EventDrivenSimulation:
+    """
+    Poisson call arrivals per subscriber with exponential inter-arrival times.
+    The rate -ln(1 - p) reproduces the per-second Bernoulli(p) draw of Subscriber.act.
+    Idle UEs are moved lazily (closed form) when they place a call; in-call UEs are
+    moved and checked for handover/drop every measurement_interval seconds.
+    With a PhaseTimer on the network, one profile row is closed per simulated second
+    (events in (k - 1, k] go to row k), so the series lines up with tick mode.
+    """
+
+    def __init__(self, network, measurement_interval=1):
+        self.network = network
+        self.measurement_interval = measurement_interval
+        self.now = network.clock.now
+        self.queue = []
+        self.sequence = itertools.count()
+        self.moved_at = {}
+        self.measurement_scheduled = False
+        self.profile_boundary = self.now + 1
+
+    def run(self, until):
+        """Process events in time order up to `until` seconds of simulated time."""
+        for sub in self.network.subscribers.values():
+            self.moved_at[sub] = self.now
+            self.schedule_arrival(sub)
+
+        while self.queue and self.queue[0][0] <= until:
+            self.now, kind, _, payload = heapq.heappop(self.queue)
+            self.close_profile_rows(self.now, inclusive=False)
+            self.network.clock.set(self.now)
+            self.network.cell_state.advance(self.now)
+            if kind == ARRIVAL:
+                self.on_arrival(payload)
+            elif kind == RETRY:
+                self.on_retry(payload)
+            elif kind == SESSION_END:
+                self.on_session_end(payload)
+            else:
+                self.on_measurement()
+        self.network.clock.set(until)
+        self.network.cell_state.advance(until)
+        self.close_profile_rows(until, inclusive=True)
+
+    def close_profile_rows(self, time, inclusive):
+        """End the profiler row of every whole simulated second before `time` (or up to it, inclusive)."""
+        profiler = self.network.profiler
+        if not profiler.enabled:
+            return
+        while self.profile_boundary < time or (inclusive and self.profile_boundary == time):
+            profiler.end_tick()
+            self.profile_boundary += 1
+
+    def push(self, at, kind, payload=None):
+        heapq.heappush(self.queue, (at, kind, next(self.sequence), payload))
+
+    def schedule_arrival(self, sub):
+        if sub.arrival_rate <= 0:
+            return
+        rate = -math.log1p(-sub.arrival_rate) if sub.arrival_rate < 1 else math.inf
+        self.push(self.now + random.expovariate(rate), ARRIVAL, sub)
+
+    def on_arrival(self, sub):
+        self.schedule_arrival(sub)
+        # Как и в Subscriber.act: занятый или ждущий переповтора абонент не звонит
+        if self.network.is_busy(sub) or self.network.retrials.is_waiting(sub):
+            return
+        duration = max(1, int(random.expovariate(1 / sub.avg_duration)))
+        self.attempt(sub, duration)
+
+    def on_retry(self, sub):
+        """Wake-up from network.retrials: attempt every retry that is due now."""
+        for retry in self.network.retrials.pop_due(self.now).values():
+            self.attempt(retry.subscriber, retry.duration, retry)
+
+    def attempt(self, sub, duration, retry=None):
+        """Catch the idle UE up to now, then try to connect; a blocked call is requeued by the network."""
+        sub.user_equipment.advance(self.now - self.moved_at[sub])
+        self.moved_at[sub] = self.now
+        if retry is not None:
+            connected = self.network.retry_call(retry, self.now)
+        else:
+            connected = self.network.request_call(sub, duration, self.now)
+        if not connected:
+            pending = self.network.retrials.pending.get(sub)
+            if pending is not None:
+                self.push(pending.due, RETRY, sub)
+            return
+
+        session = self.network.find_session(sub)
+        self.push(session.end_time, SESSION_END, session)
+        if not self.measurement_scheduled:
+            self.measurement_scheduled = True
+            self.push(self.now + self.measurement_interval, MEASUREMENT)
+
+    def on_session_end(self, session):
+        if self.network.find_session(session.subscriber) is not session:
+            return  # уже сброшен при измерении
+        self.move_in_call(session.subscriber)
+        self.network.close_session(session, "COMPLETED")
+
+    def on_measurement(self):
+        """Move in-call UEs and run handover/drop checks for every active session."""
+        for session in list(self.network.active_sessions):
+            self.move_in_call(session.subscriber)
+            self.network.update_session(session)
+
+        self.measurement_scheduled = bool(self.network.active_sessions)
+        if self.measurement_scheduled:
+            self.push(self.now + self.measurement_interval, MEASUREMENT)
+
+    def move_in_call(self, sub):
+        sub.user_equipment.advance(self.now - self.moved_at[sub])
+        self.moved_at[sub] = self.now
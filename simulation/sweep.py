@@ -0,0 +1,192 @@
+"""
+Parameter sweeps for cell dimensioning: grid or Latin hypercube over capacity, traffic and layout.
+"""
+import csv
+import hashlib
+import itertools
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from .replication import replication_config, seed_streams, run_replication, summarize
+from .constants import SWEEP_PARAMETERS, DEFAULT_SWEEP_CACHE_DIR
+
+TABLE_METRICS = ('blocking_rate', 'capacity_blocking_rate', 'drop_rate', 'total_attempts', 'handovers')
+
+
+def grid_points(space):
+    """Full factorial design: space maps parameter -> list of levels."""
+    names = list(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(space[n] for n in names))]
+
+
+def latin_hypercube(space, samples, seed=0):
+    """
+    Latin hypercube design with `samples` points.
+
+    A (low, high) tuple is a continuous range (kept integer when both bounds are ints);
+    a list is a set of categorical levels, stratified the same way.
+    """
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for name, spec in space.items():
+        u = (rng.permutation(samples) + rng.random(samples)) / samples
+        if isinstance(spec, tuple):
+            low, high = spec
+            values = low + u * (high - low)
+            if isinstance(low, int) and isinstance(high, int):
+                values = np.minimum(np.floor(low + u * (high - low + 1)), high).astype(int)
+            columns[name] = values.tolist()
+        else:
+            columns[name] = [spec[i] for i in (u * len(spec)).astype(int)]
+    return [{name: columns[name][i] for name in space} for i in range(samples)]
+
+
+def apply_point(config, point, layouts=None):
+    """Copy of config with one sweep point applied."""
+    unknown = set(point) - set(SWEEP_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown sweep parameters: {sorted(unknown)}")
+    if 'layout' in point and point['layout'] not in (layouts or {}):
+        raise ValueError(f"Sweep point uses layout {point['layout']!r}, but it is not in the given layouts")
+    config = replication_config(config)
+    if 'layout' in point:
+        config['base_stations'] = [dict(bs) for bs in layouts[point['layout']]]
+    if 'capacity' in point:
+        for bs in config['base_stations']:
+            bs['capacity'] = int(point['capacity'])
+    for key in ('arrival_rate', 'avg_duration'):
+        if key in point:
+            config['simulation'][key] = point[key]
+    return config
+
+
+def point_key(config, replications, seed):
+    """Content hash of a fully applied config plus replication settings."""
+    payload = json.dumps([config, replications, seed], sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+class SweepCache:
+    """One JSON file per finished sweep point, so an interrupted sweep resumes where it stopped."""
+
+    def __init__(self, directory=DEFAULT_SWEEP_CACHE_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def load(self, key):
+        try:
+            with open(self.path(key)) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def save(self, key, entry):
+        tmp = self.path(key) + ".tmp"
+        with open(tmp, 'w') as f:
+            json.dump(entry, f)
+        os.replace(tmp, self.path(key))
+
+
+def run_sweep(config, points, replications=4, seed=0, workers=None, layouts=None, cache=None):
+    """
+    Simulate every point `replications` times across a process pool.
+
+    All points share the same seed streams (common random numbers), so differences between
+    points come from the parameters, not the noise. Finished points are written to `cache`
+    (a SweepCache, or a directory path) as soon as their last replication completes.
+    Returns one summary entry per point, in the order of `points`.
+    """
+    if isinstance(cache, str):
+        cache = SweepCache(cache)
+    streams = seed_streams(seed, replications)
+    entries, pending = _load_cached(config, points, replications, seed, layouts, cache)
+    if not pending:
+        return entries
+    results = {i: [] for i in pending}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(run_replication, point_config, stream, r): i
+            for i, (key, point_config) in pending.items()
+            for r, stream in enumerate(streams)
+        }
+        for future in as_completed(futures):
+            i = futures[future]
+            results[i].append(future.result())
+            if len(results[i]) == replications:
+                entries[i] = _finish_point(points[i], results[i], seed, pending[i][0], cache)
+    return entries
+
+
+def _finish_point(point, runs, seed, key, cache):
+    """Summary entry for a point whose replications all completed, saved to `cache` under `key`."""
+    runs = sorted(runs, key=lambda run: run['replication'])
+    entry = {"point": point, "replications": len(runs), "seed": seed, "summary": summarize(runs)}
+    if cache:
+        cache.save(key, entry)
+    return entry
+
+
+def _load_cached(config, points, replications, seed, layouts, cache):
+    """Apply every point; returns (entries with cache hits filled in, {index: (key, config)} still to run)."""
+    entries = [None] * len(points)
+    pending = {}
+    for i, point in enumerate(points):
+        point_config = apply_point(config, point, layouts)
+        key = point_key(point_config, replications, seed)
+        cached = cache.load(key) if cache else None
+        if cached is not None:
+            entries[i] = cached
+        else:
+            pending[i] = (key, point_config)
+    return entries, pending
+
+
+def tidy_table(entries, metrics=TABLE_METRICS):
+    """Flatten sweep entries to one row per point: parameters, then mean and CI per metric."""
+    rows = []
+    for entry in entries:
+        row = dict(entry["point"])
+        row["replications"] = entry["replications"]
+        for metric in metrics:
+            stats = entry["summary"][metric]
+            row[metric] = stats["mean"]
+            row[f"{metric}_ci_low"] = stats["ci_low"]
+            row[f"{metric}_ci_high"] = stats["ci_high"]
+        rows.append(row)
+    return rows
+
+
+def write_csv(rows, path):
+    """Save a tidy table as CSV."""
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def print_table(rows, metrics=('blocking_rate', 'drop_rate')):
+    """Console view of a tidy table: parameters plus mean [CI] of selected metrics."""
+    params = [key for key in rows[0] if key in SWEEP_PARAMETERS]
+    print(" | ".join(params + list(metrics)))
+    for row in rows:
+        cells = [str(row[p]) for p in params]
+        cells += [f"{row[m]:.4f} [{row[m + '_ci_low']:.4f}, {row[m + '_ci_high']:.4f}]" for m in metrics]
+        print(" | ".join(cells))
+
+
+if __name__ == "__main__":
+    from utils import load_config
+
+    base = load_config("config.yaml")
+    space = {"capacity": [1, 2, 4], "arrival_rate": [0.002, 0.01, 0.05]}
+    table = tidy_table(run_sweep(base, grid_points(space), cache=DEFAULT_SWEEP_CACHE_DIR))
+    print_table(table)
+    if len(sys.argv) > 1:
+        write_csv(table, sys.argv[1])
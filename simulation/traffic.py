@@ -0,0 +1,103 @@
+"""
+Population-level call arrivals: one vectorized draw per tick instead of Subscriber.act per subscriber.
+"""
+import numpy as np
+from events.constants import RETRY
+from .constants import TRAFFIC_BLOCK
+
+
+class TrafficGenerator:
+    """
+    Owns per-subscriber arrival probabilities (per second) and mean call durations as arrays.
+
+    Same model as Subscriber.act: an idle subscriber without a pending retrial calls with
+    probability arrival_rate each second, duration max(1, int(Exp(avg_duration))); blocked
+    calls go to network.retrials and are retried there per its RetryPolicy. Uniforms,
+    durations and retry delays come from one seeded numpy Generator (uniforms for `block`
+    ticks at once), so a run is reproducible from `seed` alone; only the subscribers
+    that fire reach the network, as one Network.connect_calls batch in subscriber order.
+    """
+
+    def __init__(self, network, seed=None, block=TRAFFIC_BLOCK):
+        self.network = network
+        self.rng = np.random.default_rng(seed)
+        self.block = block
+        self.subscribers = []
+        self.arrival_rate = np.empty(0)
+        self.avg_duration = np.empty(0)
+        self.index_of = {}
+        self._uniforms = np.empty((0, 0))
+        self._row = 0
+        self.sync()
+
+    def sync(self):
+        """Pick up subscribers added to the network since the last call."""
+        subscribers = list(self.network.subscribers.values())
+        added = subscribers[len(self.subscribers):]
+        if not added:
+            return
+        self.index_of.update((sub, index) for index, sub in enumerate(added, start=len(self.subscribers)))
+        self.subscribers = subscribers
+        self.arrival_rate = np.concatenate([self.arrival_rate, [sub.arrival_rate for sub in added]])
+        self.avg_duration = np.concatenate([self.avg_duration, [sub.avg_duration for sub in added]])
+        self._row = len(self._uniforms)  # redraw at the new population size
+
+    def set_rates(self, arrival_rate=None, avg_duration=None):
+        """Override per-subscriber rates (scalars or arrays in network.subscribers order)."""
+        if arrival_rate is not None:
+            self.arrival_rate = np.broadcast_to(np.asarray(arrival_rate, dtype=float), self.arrival_rate.shape).copy()
+        if avg_duration is not None:
+            self.avg_duration = np.broadcast_to(np.asarray(avg_duration, dtype=float), self.avg_duration.shape).copy()
+
+    def step(self, now):
+        """Generate and admit this second's attempts. Returns the number of attempts made."""
+        if len(self.network.subscribers) != len(self.subscribers):
+            self.sync()
+        due = self.network.retrials.pop_due(now)
+        # index -> (duration, PendingRetry or None for a first attempt)
+        requests = {self.index_of[sub]: (retry.duration, retry) for sub, retry in due.items()}
+        requests.update(self._arrivals(due))
+        if not requests:
+            return 0
+        return self._admit(requests, now)
+
+    def _arrivals(self, due):
+        """First attempts of this second: {index: (duration, None)} for subscribers that fire."""
+        if self._row == len(self._uniforms):
+            self._uniforms = self.rng.random((self.block, len(self.subscribers)))
+            self._row = 0
+        uniforms = self._uniforms[self._row]
+        self._row += 1
+
+        retrials = self.network.retrials
+        # Callers with a retry pending or due this second do not place a fresh call
+        fire = [index for index in np.flatnonzero(uniforms < self.arrival_rate).tolist()
+                if not retrials.is_waiting(self.subscribers[index]) and self.subscribers[index] not in due]
+        if not fire:
+            return {}
+        durations = np.maximum(1, self.rng.exponential(self.avg_duration[fire]).astype(np.int64))
+        return {index: (duration, None) for index, duration in zip(fire, durations.tolist())}
+
+    def _admit(self, requests, now):
+        """One connect_calls batch in subscriber order; failures go back to network.retrials."""
+        network = self.network
+        batch = []
+        retries = []
+        for index in sorted(requests):
+            sub = self.subscribers[index]
+            if network.is_busy(sub):
+                continue
+            duration, retry = requests[index]
+            if retry is not None:
+                network.events.publish(RETRY, now, sub)
+            batch.append((sub, duration, now))
+            retries.append(retry)
+
+        failed = []
+        for (sub, duration, _), retry, connected in zip(batch, retries, network.connect_calls(batch)):
+            if retry is not None:
+                network.retrials.record(connected)
+            if not connected:
+                failed.append((sub, duration, retry.attempt + 1 if retry is not None else 1))
+        network.retrials.schedule_many(failed, now, self.rng)
+        return len(batch)
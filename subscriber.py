@@ -2,9 +2,12 @@ import random
 import time
 import math
 import datetime
-import matplotlib.pyplot as plt
 
 class Subscriber:
+    __slots__ = ('first_name', 'last_name', 'id_number', 'user_equipment', 'email', 'phone', 'balance',
+                 'subscribed', 'bonus_balance', 'tariff', 'arrival_rate', 'avg_duration',
+                 'retrial_timer', 'pending_duration')
+
     def __init__(self, first_name, last_name, id_number, user_equipment, email, phone, tariff, arrival_rate, avg_duration):
         self.first_name = first_name
         self.last_name = last_name
@@ -80,6 +83,8 @@ class Subscriber:
         return any(session.subscriber == self for session in network.active_sessions)
 
 class BaseStation:
+    __slots__ = ('id', 'capacity', 'current_calls', 'tx_power', 'rx_sensitivity', 'location_x', 'location_y')
+
     def __init__(self, id, capacity, location_x, location_y):
         self.id = id
         self.capacity = capacity
@@ -126,6 +131,9 @@ class BaseStation:
         return None
 
 class UserEquipment:
+    __slots__ = ('ue_id', 'location_x', 'location_y', 'velocity_x', 'velocity_y', 'tx_power', 'rx_sensitivity',
+                 'history')
+
     def __init__(self, ue_id, location_x, location_y):
         self.ue_id = ue_id
         self.location_x = random.randint(0, 1000)
@@ -176,6 +184,8 @@ class UserEquipment:
 
 
 class Tariff:
+    __slots__ = ('tariff_name', 'cost_per_minute')
+
     def __init__(self, tariff_name, cost_per_minute):
         self.tariff_name = tariff_name
         self.cost_per_minute = cost_per_minute
@@ -190,6 +200,8 @@ class Tariff:
         self.cost_per_minute = cost_per_minute
 
 class CallSession:
+    __slots__ = ('subscriber', 'base_station', 'remaining_time', 'duration', 'start_time')
+
     def __init__(self, subscriber, base_station, duration, start_time):
         self.subscriber = subscriber
         self.base_station = base_station
@@ -454,6 +466,7 @@ class Network:
         y_coords = [e['y'] for e in history]
         rsrp_vals = [e['rsrp'] for e in history]
 
+        import matplotlib.pyplot as plt
         plt.figure(figsize=(10, 8))
         
         # Рисуем путь абонента (цвет зависит от силы сигнала)
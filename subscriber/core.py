@@ -2,10 +2,12 @@
 Subscriber management module.
 """
 import random
-import time
 
 
 class Subscriber:
+    __slots__ = ('first_name', 'last_name', 'id_number', 'user_equipment', 'email', 'phone', 'balance',
+                 'subscribed', 'bonus_balance', 'tariff', 'arrival_rate', 'avg_duration')
+
     def __init__(self, first_name, last_name, id_number, user_equipment, email, phone, tariff, arrival_rate, avg_duration):
         self.first_name = first_name
         self.last_name = last_name
@@ -19,8 +21,6 @@ class Subscriber:
         self.tariff = tariff
         self.arrival_rate = arrival_rate
         self.avg_duration = avg_duration
-        self.retrial_timer = 0
-        self.pending_duration = 0
 
     def top_up(self, amount):
         self.balance += amount
@@ -48,33 +48,20 @@ class Subscriber:
         cost_per_min = self.tariff.get_cost_per_minute()
         total_cost = duration * cost_per_min
         if self.balance < total_cost:
-            print(f"Недостаточно денег на балансе: нужно {total_cost} руб., на балансе {self.balance} руб.")
             return False
         self.balance -= total_cost
         self.bonus_balance += total_cost * 0.05
         return True
 
     def act(self, network):
-        if self.is_busy(network):
-            return
-        
-        if self.retrial_timer > 0:
-            self.retrial_timer -= 1
-            if self.retrial_timer == 0:
-                print(f"--- {self.first_name} делает ПОВТОРНУЮ попытку ---")
-                success = network.connect_call(self, self.pending_duration, time.time())
-                if not success:
-                    self.retrial_timer = random.randint(5, 15)
+        # Blocked calls wait in network.retrials; the simulation loop retries them when due
+        if self.is_busy(network) or network.retrials.is_waiting(self):
             return
 
         if random.random() < self.arrival_rate:
             duration = max(1, int(random.expovariate(1/self.avg_duration)))
-            success = network.connect_call(self, duration, time.time())
-
-            if not success:
-                self.pending_duration = duration
-                self.retrial_timer = random.randint(5, 15)
+            network.request_call(self, duration, network.clock.now)
 
     def is_busy(self, network):
-        return any(session.subscriber == self for session in network.active_sessions)
+        return network.is_busy(self)
 
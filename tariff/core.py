@@ -4,6 +4,8 @@ Tariff management module.
 
 
 class Tariff:
+    __slots__ = ('tariff_name', 'cost_per_minute')
+
     def __init__(self, tariff_name, cost_per_minute):
         self.tariff_name = tariff_name
         self.cost_per_minute = cost_per_minute
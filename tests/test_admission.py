@@ -0,0 +1,62 @@
+import random
+from tariff import Tariff
+from network import Network
+from base_station import BaseStation
+from subscriber import Subscriber
+from equipment import UserEquipment
+from benchmarks.generators import synthetic_config
+from simulation import build_network
+
+
+def make_network(capacity, balances):
+    """Two co-sited cells with `capacity` calls each; one subscriber per balance, all at the site."""
+    network = Network()
+    for bs_id in ("BS-01", "BS-02"):
+        network.add_base_station(BaseStation(bs_id, capacity, 500, 500, 1800, 5, "omni"))
+    tariff = Tariff("Basic", 1)
+    for i, balance in enumerate(balances):
+        ue = UserEquipment(f"UE-{i}", 0, 0)
+        ue.location_x, ue.location_y = 510, 500
+        sub = Subscriber("Sub", str(i), str(i), ue, "", str(i), tariff, 0.0, 60)
+        sub.top_up(balance)
+        network.add_subscriber(sub)
+    return network
+
+
+def test_connect_call_counts_each_blocked_attempt_once():
+    network = make_network(1, [100, 0, 100, 100])
+    outcomes = [network.connect_call(sub, 60, 0.0) for sub in network.subscribers.values()]
+
+    assert outcomes == [True, False, True, False]
+    counters = network.get_counters()
+    # One balance refusal although two cells had room, one attempt with every cell full
+    assert (counters["blocked_by_balance"], counters["blocked_by_capacity"]) == (1, 1)
+    assert counters["total_attempts"] == counters["total_successful_calls"] + 2
+
+
+def test_connect_calls_matches_sequential_connect_call():
+    def build():
+        random.seed(0)
+        config = synthetic_config(20, 300)
+        for bs in config['base_stations']:
+            bs['capacity'] = 3
+        for sub in config['subscribers']:
+            sub['initial_balance'] = random.choice([0, 30, 100, 10**6])
+        return build_network(config)
+
+    sequential, batched = build(), build()
+    rng = random.Random(1)
+    phones = list(sequential.subscribers)
+    requests = [(rng.choice(phones), rng.randint(1, 60)) for _ in range(600)]
+
+    expected = [sequential.connect_call(sequential.subscribers[p], d, 0.0) for p, d in requests]
+    assert batched.connect_calls([(batched.subscribers[p], d, 0.0) for p, d in requests]) == expected
+
+    def state(network):
+        return (network.get_counters(),
+                [(sub.balance, sub.bonus_balance) for sub in network.subscribers.values()],
+                [bs.current_calls for bs in network.base_stations.values()],
+                [(s.subscriber.phone, s.base_station.id, s.duration) for s in network.active_sessions])
+
+    assert state(batched) == state(sequential)
+    assert 0 < batched.blocked_by_balance and 0 < batched.blocked_by_capacity
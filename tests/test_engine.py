@@ -0,0 +1,40 @@
+import random
+import pytest
+from base_station import BaseStation
+from benchmarks.generators import synthetic_config
+from simulation import build_network, run_simulation, run_ticks
+
+
+def simulate(engine, mode="tick", seed=0):
+    random.seed(seed)
+    config = synthetic_config(20, 400, engine=engine, mode=mode, duration_seconds=201, arrival_rate=0.01)
+    network = build_network(config)
+    run_simulation(network, config['simulation'], progress=False)
+    return network
+
+
+def outcome(network):
+    return network.get_counters(), network.cdr_manager.query(), network.cell_state.busy_seconds.tolist()
+
+
+@pytest.mark.parametrize("mode", ["tick", "event"])
+def test_vectorized_engine_matches_object_path(mode):
+    expected = simulate("object", mode)
+    assert expected.handovers > 0 and expected.completed_calls > 0
+    assert outcome(simulate("vectorized", mode)) == outcome(expected)
+
+
+def test_vectorized_engine_follows_replaced_station():
+    def run(engine):
+        random.seed(0)
+        network = build_network(synthetic_config(20, 400, engine=engine))
+        run_ticks(network, 100, progress=False)
+        # Sessions keep their BaseStation object, so move a cell that carries none
+        old = next(bs for bs in network.base_stations.values() if not bs.current_calls)
+        busiest = max(network.base_stations.values(), key=lambda bs: bs.current_calls)
+        network.add_base_station(BaseStation(old.id, old.capacity, busiest.location_x + 50, busiest.location_y,
+                                             old.frequency, old.bandwidth, old.antenna_type))
+        run_ticks(network, 200, progress=False)
+        return outcome(network)
+
+    assert run("vectorized") == run("object")
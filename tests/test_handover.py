@@ -0,0 +1,23 @@
+import random
+import pytest
+from benchmarks.generators import synthetic_config
+from simulation import build_network, run_simulation
+
+
+def simulate(engine, handover, **options):
+    random.seed(0)
+    config = synthetic_config(30, 400, engine=engine, handover=handover, duration_seconds=201,
+                              arrival_rate=0.01, **options)
+    network = build_network(config)
+    run_simulation(network, config['simulation'], progress=False)
+    return network
+
+
+@pytest.mark.parametrize("engine", ["object", "vectorized"])
+def test_incremental_handover_matches_full_ranking(engine):
+    full = simulate(engine, "full")
+    incremental = simulate(engine, "incremental", rerank_distance=0)
+    assert full.handovers > 0
+    assert incremental.get_counters() == full.get_counters()
+    assert incremental.cdr_manager.query() == full.cdr_manager.query()
+    assert incremental.handover is not None and full.handover is None
@@ -0,0 +1,44 @@
+import random
+from base_station import BaseStation
+from benchmarks.generators import synthetic_config, random_layout
+from simulation import build_network
+from network.physics import check_connection_quality
+
+
+def heard(network, ue, stations):
+    return [bs for bs in stations if check_connection_quality(ue, bs)[0]]
+
+
+def assert_matches_full_scan(network):
+    for sub in network.subscribers.values():
+        ue = sub.user_equipment
+        assert heard(network, ue, network.nearby_base_stations(ue)) == heard(network, ue, network.base_stations.values())
+
+
+def wide_network():
+    """Sites scattered over 30 km around the 1 km city, so most cells are out of reach."""
+    random.seed(0)
+    config = synthetic_config(1, 500)
+    config['base_stations'] = random_layout(400, size=30_000)
+    for bs in config['base_stations']:
+        bs['x'] -= 14_500
+        bs['y'] -= 14_500
+    return build_network(config)
+
+
+def test_nearby_base_stations_matches_full_scan():
+    network = wide_network()
+    assert_matches_full_scan(network)
+    ue = next(iter(network.subscribers.values())).user_equipment
+    assert len(network.nearby_base_stations(ue)) < len(network.base_stations) / 4
+
+
+def test_nearby_base_stations_follows_replaced_station():
+    network = wide_network()
+    rng = random.Random(1)
+    for bs_id in rng.sample(sorted(network.base_stations), 40):
+        old = network.base_stations[bs_id]
+        network.add_base_station(BaseStation(old.id, old.capacity, rng.uniform(-2000, 3000), rng.uniform(-2000, 3000),
+                                             old.frequency, old.bandwidth, old.antenna_type))
+    assert_matches_full_scan(network)
+    assert len(network.cell_index.stations) == len(network.base_stations)
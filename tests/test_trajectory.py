@@ -0,0 +1,27 @@
+import numpy as np
+from equipment.trajectory import TrajectoryStore
+
+
+def fill(store, count):
+    for t in range(count):
+        store.append(float(t), t, t, -80.0, "BS-01")
+
+
+def test_spill_file_is_not_shared_between_runs(tmp_path):
+    path = str(tmp_path / "UE-01.traj")
+    first = TrajectoryStore(max_samples=4, spill_path=path)
+    fill(first, 10)
+    assert len(first.load_all()) == 10
+
+    second = TrajectoryStore(max_samples=4, spill_path=path)
+    fill(second, 10)
+    samples = second.load_all()
+    assert len(samples) == 10
+    np.testing.assert_array_equal(samples['time'], np.arange(10.0))
+
+
+def test_load_all_without_spill_is_retained_window():
+    store = TrajectoryStore(max_samples=4)
+    fill(store, 10)
+    np.testing.assert_array_equal(store.load_all()['time'], [6.0, 7.0, 8.0, 9.0])
+    assert store.base_station_ids(store.view()['cell']) == ["BS-01"] * 4
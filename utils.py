@@ -1,6 +1,7 @@
 """
 Utility functions for configuration and common operations.
 """
+import sys
 import yaml
 
 
@@ -18,3 +19,30 @@ def load_config(file_path: str) -> dict:
         return yaml.safe_load(f)
 
 
+def intern_id(value):
+    """Intern string ids/names so equal values parsed from YAML share one object; other types pass through."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Interner:
+    """
+    Maps hashable values (subscriber ids, cell ids) to dense small integers and back.
+    """
+
+    def __init__(self):
+        self.codes = {}
+        self.values = []
+
+    def intern(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+    def lookup(self, code):
+        return self.values[code]
+
+    def __len__(self):
+        return len(self.values)